@@ -0,0 +1,281 @@
+# Asyncio scraping backend.
+#
+# The scrapers in utils are blocking, so scraping_engine needs one thread per
+# request in flight and a slow host ties up a worker. This module fetches the
+# same pages with httpx on a single event loop: one AsyncClient (one
+# connection pool) shared by every request, so a process can have hundreds of
+# listing and description requests in flight without a thread each. Page
+# parsing is shared with the blocking scrapers (utils.parse_*), so both
+# backends return identical results.
+#
+# The loop runs in a background daemon thread. The synchronous entry points
+# (iter_platform_results, scrape_platforms, fetch_job_descriptions) submit
+# coroutines to it, so the Streamlit app and scraping_engine can call them
+# like the threaded versions. Naukri needs a browser and still runs in a
+# thread, via the loop's default executor.
+#
+# Select it with CVISION_SCRAPE_BACKEND=async (requires httpx).
+import asyncio
+import queue
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+import config
+import http_client
+import utils
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_loop = None
+_loop_lock = threading.Lock()
+_client = None
+_stats = {'requests': 0, 'errors': 0, 'retries': 0}
+
+
+def available():
+    return httpx is not None
+
+
+def get_loop():
+    """Return the backend's event loop, starting its thread on first use."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="async-scraping", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def run(coro, timeout=None):
+    """Run a coroutine on the backend loop from synchronous code and return its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result(timeout)
+
+
+def _get_client():
+    # Only called on the backend loop, so no lock is needed
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            headers={'User-Agent': http_client.USER_AGENT, 'Accept-Encoding': http_client.accept_encoding()},
+            timeout=config.HTTP_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=config.ASYNC_MAX_CONNECTIONS,
+                                max_keepalive_connections=config.ASYNC_MAX_KEEPALIVE),
+            # Retries connection failures; status retries are handled in fetch_text
+            transport=httpx.AsyncHTTPTransport(retries=config.HTTP_RETRIES),
+            follow_redirects=True,
+        )
+    return _client
+
+
+async def fetch_text(url):
+    """GET url and return the response body; retries 429/5xx with backoff and raises on HTTP errors."""
+    client = _get_client()
+    attempt = 0
+    while True:
+        _stats['requests'] += 1
+        try:
+            response = await client.get(url)
+        except httpx.HTTPError:
+            _stats['errors'] += 1
+            raise
+        if response.status_code in http_client.RETRY_STATUSES and attempt < config.HTTP_RETRIES:
+            retry_after = response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() else config.HTTP_RETRY_BACKOFF * (2 ** attempt)
+            attempt += 1
+            _stats['retries'] += 1
+            await asyncio.sleep(delay)
+            continue
+        if response.status_code >= 400:
+            _stats['errors'] += 1
+        response.raise_for_status()
+        return response.text
+
+
+async def _scrape_html(platform, url, parse):
+    print(f"Requesting URL: {url} (async)")
+    try:
+        html = await fetch_text(url)
+        jobs = parse(html)
+        print(f"Scraped {len(jobs)} jobs from {platform}")
+        return jobs
+    except Exception as e:
+        print(f"Error scraping {platform}: {e}")
+        print(traceback.format_exc())
+        return []
+
+
+async def scrape_linkedin(domain, location="India"):
+    return await _scrape_html("LinkedIn", utils.linkedin_search_url(domain, location), utils.parse_linkedin_jobs)
+
+
+async def scrape_upwork(domain):
+    return await _scrape_html("Upwork", utils.upwork_search_url(domain), utils.parse_upwork_jobs)
+
+
+async def scrape_fiverr(domain):
+    return await _scrape_html("Fiverr", utils.fiverr_search_url(domain), utils.parse_fiverr_jobs)
+
+
+async def scrape_indeed(domain, location="India"):
+    return await _scrape_html("Indeed", utils.indeed_search_url(domain, location), utils.parse_indeed_jobs)
+
+
+async def scrape_internshala(domain):
+    return await _scrape_html("Internshala", utils.internshala_search_url(domain), utils.parse_internshala_jobs)
+
+
+async def scrape_naukri(domain, location="India"):
+    # Rendered with Selenium; keep it off the event loop
+    return await asyncio.get_running_loop().run_in_executor(None, utils.scrape_naukri, domain, location)
+
+
+async def fetch_job_description(job_url):
+    """Async utils.fetch_job_description: raises on network and HTTP errors."""
+    return utils.parse_job_description(await fetch_text(job_url))
+
+
+async def get_job_description(job_url):
+    try:
+        return await fetch_job_description(job_url)
+    except Exception as e:
+        print(f"Error fetching job description from {job_url}: {e}")
+        return ""
+
+
+PLATFORM_SCRAPERS = {
+    "LinkedIn": scrape_linkedin,
+    "Upwork": scrape_upwork,
+    "Fiverr": scrape_fiverr,
+    "Indeed": scrape_indeed,
+    "Naukri.com": scrape_naukri,
+    "Internshala": scrape_internshala,
+}
+
+
+async def _run_scraper(platform, domain):
+    start = time.perf_counter()
+    jobs = await PLATFORM_SCRAPERS[platform](domain)
+    for job in jobs:
+        job['platform'] = platform
+    return jobs, time.perf_counter() - start
+
+
+def iter_platform_results(domain, platforms, deadline=None):
+    """Async-backed scraping_engine.iter_platform_results: yields one result dict per platform as it completes."""
+    deadline = config.SCRAPE_DEADLINE_SECONDS if deadline is None else deadline
+    platforms = [p for p in platforms if p in PLATFORM_SCRAPERS]
+    if not platforms:
+        return
+
+    start = time.perf_counter()
+    done = queue.Queue()
+    loop = get_loop()
+    futures = {}
+    for platform in platforms:
+        future = asyncio.run_coroutine_threadsafe(_run_scraper(platform, domain), loop)
+        future.add_done_callback(lambda future, platform=platform: done.put((platform, future)))
+        futures[platform] = future
+
+    pending = set(platforms)
+    try:
+        while pending:
+            remaining = deadline - (time.perf_counter() - start)
+            if remaining <= 0:
+                break
+            try:
+                platform, future = done.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending.discard(platform)
+            try:
+                jobs, seconds = future.result()
+                print(f"Found {len(jobs)} jobs on {platform} in {seconds:.1f}s")
+                yield {'platform': platform, 'status': 'ok', 'jobs': jobs,
+                       'seconds': seconds, 'error': None}
+            except Exception as e:
+                print(f"Error scraping {platform}: {str(e)}")
+                yield {'platform': platform, 'status': 'error', 'jobs': [],
+                       'seconds': time.perf_counter() - start, 'error': str(e)}
+
+        elapsed = time.perf_counter() - start
+        for platform in platforms:
+            if platform in pending:
+                print(f"{platform} did not finish within the {deadline:.0f}s deadline")
+                yield {'platform': platform, 'status': 'timeout', 'jobs': [],
+                       'seconds': elapsed, 'error': f"Timed out after {deadline:.0f}s"}
+    finally:
+        for platform in pending:
+            futures[platform].cancel()
+
+
+def scrape_platforms(domain, platforms, deadline=None):
+    """Return (all_jobs, results) like scraping_engine.scrape_platforms, using the async backend."""
+    results = {result['platform']: result for result in iter_platform_results(domain, platforms, deadline)}
+    all_jobs = [job for platform in platforms if platform in results for job in results[platform]['jobs']]
+    return all_jobs, [results[p] for p in platforms if p in results]
+
+
+async def fetch_job_descriptions_async(urls, deadline=None, per_host=None):
+    """Fetch job descriptions concurrently and return {url: result} (see scraping_engine.fetch_job_descriptions)."""
+    deadline = config.DESCRIPTION_FETCH_DEADLINE_SECONDS if deadline is None else deadline
+    per_host = per_host or config.DESCRIPTION_FETCH_PER_HOST
+    urls = list(OrderedDict.fromkeys(url for url in urls if url))
+    results = {}
+    if not urls:
+        return results
+
+    host_slots = {}
+    for url in urls:
+        host_slots.setdefault(urlparse(url).netloc, asyncio.Semaphore(per_host))
+    start = time.perf_counter()
+
+    async def fetch(url):
+        async with host_slots[urlparse(url).netloc]:
+            fetch_start = time.perf_counter()
+            try:
+                description = await fetch_job_description(url)
+                results[url] = {'status': 'ok' if description else 'empty', 'description': description,
+                                'seconds': time.perf_counter() - fetch_start, 'error': None}
+            except Exception as e:
+                print(f"Error fetching job description from {url}: {e}")
+                results[url] = {'status': 'error', 'description': "",
+                                'seconds': time.perf_counter() - fetch_start, 'error': str(e)}
+
+    print(f"Fetching {len(urls)} job descriptions (async, {per_host} per host)")
+    tasks = [asyncio.ensure_future(fetch(url)) for url in urls]
+    _, pending = await asyncio.wait(tasks, timeout=deadline)
+    if pending:
+        print(f"Job description fetch hit the {deadline:.0f}s deadline")
+        for task in pending:
+            task.cancel()
+
+    for url in urls:
+        if url not in results:
+            results[url] = {'status': 'timeout', 'description': "",
+                            'seconds': time.perf_counter() - start,
+                            'error': f"Timed out after {deadline:.0f}s"}
+
+    counts = {}
+    for result in results.values():
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    print(f"Fetched job descriptions in {time.perf_counter() - start:.1f}s: {counts}")
+    return results
+
+
+def fetch_job_descriptions(urls, deadline=None, per_host=None):
+    """Synchronous wrapper around fetch_job_descriptions_async."""
+    deadline = config.DESCRIPTION_FETCH_DEADLINE_SECONDS if deadline is None else deadline
+    # The coroutine enforces the deadline itself; the margin only guards against a stuck loop
+    return run(fetch_job_descriptions_async(urls, deadline, per_host), timeout=deadline + 10)
+
+
+def stats():
+    return dict(_stats)
@@ -0,0 +1,263 @@
+# Batch CV ingestion: extract text, domain and skills for a folder of resumes.
+#
+#   python batch_ingest.py resumes/ --output results.jsonl --workers 4
+#   python batch_ingest.py resumes/ --output results.parquet
+#
+# Files are handed to a process pool in chunks (--chunk-size); each worker loads
+# the models once, extracts the chunk's files one by one and then classifies
+# domains and matches skills for the whole chunk in one batched call each.
+# Results are appended to a JSONL file as soon as their chunk is done, so an
+# interrupted run picks up where it stopped when started again with the same
+# output (files already processed successfully are skipped unless they
+# changed; failed ones are retried). Once all files are done the JSONL is
+# rewritten with only the latest record per file. For a .parquet output the
+# JSONL is kept next to it as the checkpoint and converted at that point, so
+# both hold the same rows.
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+import cv_labels
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx')
+STAGES = ('read', 'extract', 'domain', 'skills')
+
+
+class LocalUpload(io.BytesIO):
+    """A file on disk presented like Streamlit's UploadedFile (a BytesIO with a name)."""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            super().__init__(f.read())
+        self.name = os.path.basename(path)
+
+
+def find_files(folder):
+    for root, _, names in os.walk(folder):
+        for name in sorted(names):
+            if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield os.path.join(root, name)
+
+
+def file_key(path, folder):
+    """Identifies a file version: relative path, size and modification time."""
+    stat = os.stat(path)
+    return f"{os.path.relpath(path, folder)}|{stat.st_size}|{int(stat.st_mtime)}"
+
+
+def load_done_keys(checkpoint):
+    """Keys of the files processed successfully in a previous (possibly interrupted) run.
+
+    Failed files are left out so the next run retries them.
+    """
+    done = set()
+    if not os.path.exists(checkpoint):
+        return done
+    with open(checkpoint, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A run killed mid-write can leave a partial last line
+                continue
+            if record.get('status') == 'ok':
+                done.add(record.get('key'))
+    return done
+
+
+def _init_worker():
+    # Files are already processed in parallel; don't start OCR or spaCy pools inside each worker
+    config.OCR_MAX_WORKERS = 1
+    config.SKILL_BATCH_PROCESSES = 1
+
+
+def _extract(path, folder):
+    """Read and extract one file; returns its record and the text (None when extraction failed)."""
+    import utils
+
+    timings = {}
+    record = {'key': file_key(path, folder), 'path': os.path.relpath(path, folder), 'status': 'ok',
+              'error': None, 'chars': 0, 'pages': [], 'domain': None, 'domain_score': None,
+              'skills': [], 'timings': timings}
+    start = time.perf_counter()
+    try:
+        stage_start = time.perf_counter()
+        upload = LocalUpload(path)
+        timings['read'] = time.perf_counter() - stage_start
+
+        stage_start = time.perf_counter()
+        text, pages = utils.extract_text_with_metadata(upload)
+        timings['extract'] = time.perf_counter() - stage_start
+        record['pages'] = pages
+        if utils.is_extraction_error(text):
+            record['status'] = 'error'
+            record['error'] = text
+            return record, None
+        record['chars'] = len(text)
+        return record, text
+    except Exception as e:
+        print(f"Error processing {path}: {str(e)}")
+        print(traceback.format_exc())
+        record['status'] = 'error'
+        record['error'] = str(e)
+        return record, None
+    finally:
+        timings['total'] = time.perf_counter() - start
+
+
+def process_files(paths, folder, run_domain=True, run_skills=True):
+    """Extract a chunk of files one by one, then classify and match skills for the chunk in batches.
+
+    Runs in a pool worker and returns one record per path, in order. The
+    domain and skills timings of a file are its share of the batch call.
+    """
+    import utils
+
+    extracted = [_extract(path, folder) for path in paths]
+    ok = [(record, text) for record, text in extracted if text is not None]
+    texts = [text for _, text in ok]
+
+    if ok and run_domain:
+        stage_start = time.perf_counter()
+        domains = utils.get_domains(texts, cv_labels.DOMAIN_LABELS)
+        share = (time.perf_counter() - stage_start) / len(ok)
+        for (record, _), (domain, score) in zip(ok, domains):
+            record['domain'] = domain
+            record['domain_score'] = float(score)
+            record['timings']['domain'] = share
+            record['timings']['total'] += share
+
+    if ok and run_skills:
+        stage_start = time.perf_counter()
+        skills = utils.extract_skills_batch(texts)
+        share = (time.perf_counter() - stage_start) / len(ok)
+        for (record, _), found in zip(ok, skills):
+            record['skills'] = found
+            record['timings']['skills'] = share
+            record['timings']['total'] += share
+
+    return [record for record, _ in extracted]
+
+
+def latest_records(checkpoint):
+    """The checkpoint's records with only the last one per file (a retried or modified file has several)."""
+    records = {}
+    with open(checkpoint, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            records.pop(record.get('path'), None)
+            records[record.get('path')] = record
+    return list(records.values())
+
+
+def compact_checkpoint(checkpoint):
+    """Rewrite the JSONL with one record per file; returns the records kept."""
+    records = latest_records(checkpoint)
+    tmp_path = checkpoint + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+    os.replace(tmp_path, checkpoint)
+    return records
+
+
+def write_parquet(records, output):
+    import pandas as pd
+
+    frame = pd.DataFrame(records)
+    # Nested per-page metadata and timings are stored as JSON strings
+    for column in ('pages', 'timings'):
+        if column in frame:
+            frame[column] = frame[column].map(json.dumps)
+    frame.to_parquet(output, index=False)
+    print(f"Wrote {len(frame)} records to {output}")
+
+
+def print_summary(records, elapsed):
+    if not records:
+        print("No files processed")
+        return
+    ok = sum(1 for record in records if record['status'] == 'ok')
+    print(f"\nProcessed {len(records)} files ({ok} ok, {len(records) - ok} failed) in {elapsed:.1f}s: "
+          f"{len(records) / elapsed:.2f} files/s")
+    print(f"{'stage':<8} {'files':>6} {'total s':>9} {'mean s':>8} {'max s':>7}")
+    for stage in STAGES + ('total',):
+        values = [record['timings'][stage] for record in records if stage in record['timings']]
+        if values:
+            print(f"{stage:<8} {len(values):>6} {sum(values):>9.1f} {sum(values) / len(values):>8.2f} "
+                  f"{max(values):>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract text, domain and skills from a folder of CVs.")
+    parser.add_argument('folder', help="folder to scan (recursively) for .pdf and .docx files")
+    parser.add_argument('--output', default='cv_results.jsonl', help="results file (.jsonl or .parquet)")
+    parser.add_argument('--workers', type=int, default=max(1, min(4, (os.cpu_count() or 2) - 1)),
+                        help="worker processes (each loads its own models)")
+    parser.add_argument('--chunk-size', type=int, default=16,
+                        help="files per worker task; domains and skills are computed per chunk in one batch")
+    parser.add_argument('--no-domain', action='store_true', help="skip domain classification")
+    parser.add_argument('--no-skills', action='store_true', help="skip skill extraction")
+    parser.add_argument('--restart', action='store_true', help="ignore results from a previous run")
+    args = parser.parse_args()
+
+    parquet = args.output.endswith('.parquet')
+    checkpoint = args.output + '.jsonl' if parquet else args.output
+    if args.restart and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    done = load_done_keys(checkpoint)
+    paths = [path for path in find_files(args.folder) if file_key(path, args.folder) not in done]
+    print(f"{len(paths)} files to process ({len(done)} already done) with {args.workers} workers")
+
+    records = []
+    start = time.perf_counter()
+    # Spawned rather than forked, so no worker inherits threads or locks (torch, tokenizers) from the parent
+    executor = ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                                   mp_context=multiprocessing.get_context("spawn"))
+    try:
+        chunk_size = max(1, args.chunk_size)
+        futures = [executor.submit(process_files, paths[i:i + chunk_size], args.folder,
+                                   not args.no_domain, not args.no_skills)
+                   for i in range(0, len(paths), chunk_size)]
+        with open(checkpoint, 'a', encoding='utf-8') as out:
+            for future in as_completed(futures):
+                try:
+                    chunk = future.result()
+                except Exception as e:
+                    # Not written to the checkpoint, so the next run retries the chunk's files
+                    print(f"Worker failed: {str(e)}")
+                    continue
+                for record in chunk:
+                    out.write(json.dumps(record) + "\n")
+                out.flush()
+                records.extend(chunk)
+                elapsed = time.perf_counter() - start
+                print(f"{len(records)}/{len(paths)} files, {len(records) / elapsed:.2f} files/s")
+    except KeyboardInterrupt:
+        print("\nInterrupted; finished results are saved. Run the same command again to resume.")
+        executor.shutdown(wait=False, cancel_futures=True)
+        print_summary(records, time.perf_counter() - start)
+        return
+    executor.shutdown()
+
+    print_summary(records, time.perf_counter() - start)
+    if os.path.exists(checkpoint):
+        # Same rows in the JSONL as in the parquet file: the latest record per file
+        latest = compact_checkpoint(checkpoint)
+        print(f"{checkpoint} holds {len(latest)} records, one per file")
+        if parquet:
+            write_parquet(latest, args.output)
+
+
+if __name__ == "__main__":
+    main()
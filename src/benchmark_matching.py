@@ -0,0 +1,79 @@
+import random
+import sys
+import time
+
+import config
+import model_registry
+import utils
+
+SAMPLE_CV = """
+Software Engineer with 5 years of experience building web applications in Python and JavaScript.
+Worked with React, Node.js, Django, PostgreSQL, Docker and AWS. Led a team of 4 developers.
+"""
+
+ROLES = ["Backend Engineer", "Data Scientist", "Frontend Developer", "DevOps Engineer",
+         "Product Manager", "Mobile Developer", "QA Engineer", "Machine Learning Engineer"]
+SKILLS = ["Python", "Java", "React", "Kubernetes", "SQL", "TensorFlow", "AWS", "Go",
+          "Figma", "Swift", "Selenium", "Docker", "Spark", "Node.js", "Terraform"]
+
+
+def make_job_descriptions(count, seed=42):
+    """Generate synthetic job descriptions of realistic length."""
+    rng = random.Random(seed)
+    descriptions = []
+    for _ in range(count):
+        role = rng.choice(ROLES)
+        skills = ", ".join(rng.sample(SKILLS, 5))
+        paragraphs = [
+            f"We are hiring a {role} to join our growing team.",
+            f"Required skills: {skills}.",
+            f"You will have {rng.randint(1, 10)}+ years of experience and strong communication skills.",
+            "You will collaborate with cross-functional teams, review code and mentor junior engineers.",
+        ]
+        descriptions.append(" ".join(paragraphs * 4))
+    return descriptions
+
+
+def score_one_by_one(cv_text, job_descs):
+    """The previous match_jobs approach: one encode() and one cosine call per job."""
+    from sentence_transformers import util
+
+    similarity_model = model_registry.get_similarity_model()
+    cv_embedding = similarity_model.encode(cv_text, convert_to_tensor=True)
+    scores = []
+    for job_desc in job_descs:
+        job_embedding = similarity_model.encode(job_desc, convert_to_tensor=True)
+        scores.append(util.pytorch_cos_sim(cv_embedding, job_embedding).item())
+    return scores
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 100, 1000]
+
+    # Measure encoding, not the embedding cache
+    config.EMBEDDING_CACHE_ENABLED = False
+
+    if not model_registry.get_similarity_model():
+        print("SentenceTransformer model not available")
+        return
+
+    # Warm up so model start-up cost isn't counted
+    utils.rank_job_descriptions(SAMPLE_CV, make_job_descriptions(4))
+
+    print(f"\n{'jobs':>6} {'sequential jobs/s':>18} {'batched jobs/s':>15} {'speedup':>8}")
+    for size in sizes:
+        job_descs = make_job_descriptions(size)
+
+        start = time.perf_counter()
+        score_one_by_one(SAMPLE_CV, job_descs)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        utils.rank_job_descriptions(SAMPLE_CV, job_descs)
+        batched = time.perf_counter() - start
+
+        print(f"{size:>6} {size / sequential:>18.1f} {size / batched:>15.1f} {sequential / batched:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import difflib
+import os
+import sys
+import time
+
+import config
+import ocr
+import utils
+
+USAGE = "Usage: python benchmark_ocr.py <folder of scanned PDF resumes>"
+
+
+def page_count(pdf_bytes):
+    import io
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return len(pdf.pages)
+
+
+def word_accuracy(text, reference):
+    """Share of the reference words OCR got right, in order (difflib matching blocks)."""
+    expected = reference.lower().split()
+    if not expected:
+        return None
+    matcher = difflib.SequenceMatcher(None, expected, text.lower().split(), autojunk=False)
+    return sum(block.size for block in matcher.get_matching_blocks()) / len(expected)
+
+
+def run(pdf_bytes, pages, **options):
+    start = time.perf_counter()
+    # One process so the timings compare CPU cost per page, not parallelism
+    results = ocr.ocr_pdf_pages(pdf_bytes, range(pages), max_workers=1, **options)
+    elapsed = time.perf_counter() - start
+    text = "".join(result['text'] for result in results)
+    confidence = sum(result['confidence'] for result in results) / len(results) if results else 0.0
+    escalated = sum(1 for result in results if result['attempts'] > 1)
+    return text, elapsed, confidence, escalated
+
+
+def main():
+    if len(sys.argv) < 2 or not os.path.isdir(sys.argv[1]):
+        print(USAGE)
+        return
+    if not utils.TESSERACT_AVAILABLE:
+        print("Tesseract OCR not available")
+        return
+    folder = sys.argv[1]
+    files = sorted(name for name in os.listdir(folder) if name.lower().endswith('.pdf'))
+    if not files:
+        print(f"No PDF files in {folder}")
+        return
+
+    print(f"Baseline: {config.OCR_RESOLUTION} DPI, no preprocessing")
+    print(f"Adaptive: {ocr.resolution_ladder()} DPI, confidence >= {config.OCR_MIN_CONFIDENCE:.0f}, "
+          f"preprocessing {'on' if config.OCR_PREPROCESS else 'off'}")
+    print("Word accuracy is shown when a <name>.txt transcript sits next to the PDF\n")
+
+    rows = []
+    for name in files:
+        with open(os.path.join(folder, name), 'rb') as f:
+            pdf_bytes = f.read()
+        pages = page_count(pdf_bytes)
+        reference = None
+        transcript = os.path.join(folder, os.path.splitext(name)[0] + '.txt')
+        if os.path.exists(transcript):
+            with open(transcript, encoding='utf-8') as f:
+                reference = f.read()
+
+        base_text, base_seconds, base_confidence, _ = run(
+            pdf_bytes, pages, resolutions=[config.OCR_RESOLUTION], min_confidence=0, preprocess=False)
+        text, seconds, confidence, escalated = run(pdf_bytes, pages)
+        rows.append({
+            'name': name, 'pages': pages, 'escalated': escalated,
+            'base_seconds': base_seconds, 'seconds': seconds,
+            'base_confidence': base_confidence, 'confidence': confidence,
+            'base_accuracy': word_accuracy(base_text, reference) if reference else None,
+            'accuracy': word_accuracy(text, reference) if reference else None,
+        })
+
+    def accuracy(value):
+        return f"{value:.1%}" if value is not None else "-"
+
+    print(f"\n{'file':<30} {'pages':>5} {'escalated':>9} {'base s':>7} {'adaptive s':>10} "
+          f"{'speedup':>8} {'base conf':>9} {'conf':>5} {'base acc':>8} {'acc':>6}")
+    for row in rows:
+        print(f"{row['name'][:30]:<30} {row['pages']:>5} {row['escalated']:>9} {row['base_seconds']:>7.2f} "
+              f"{row['seconds']:>10.2f} {row['base_seconds'] / row['seconds']:>7.1f}x "
+              f"{row['base_confidence']:>9.0f} {row['confidence']:>5.0f} "
+              f"{accuracy(row['base_accuracy']):>8} {accuracy(row['accuracy']):>6}")
+
+    total_pages = sum(row['pages'] for row in rows)
+    base_total = sum(row['base_seconds'] for row in rows)
+    total = sum(row['seconds'] for row in rows)
+    print(f"\n{len(rows)} files, {total_pages} pages: baseline {total_pages / base_total:.2f} pages/s, "
+          f"adaptive {total_pages / total:.2f} pages/s ({base_total / total:.1f}x), "
+          f"{sum(row['escalated'] for row in rows)} pages escalated to {config.OCR_RESOLUTION} DPI")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import random
+import sys
+import time
+
+import model_registry
+import skill_matcher
+import skill_taxonomy
+
+FILLER = ("Delivered projects on time for enterprise clients across several industries. "
+          "Worked closely with stakeholders, wrote documentation and reviewed pull requests. "
+          "Improved the reporting framework and organised regular knowledge sharing sessions. ")
+
+
+def make_cv(words, seed=7):
+    """Synthetic CV text of roughly the given length with a sprinkling of skills."""
+    rng = random.Random(seed)
+    filler = FILLER.split()
+    parts = []
+    while len(parts) < words:
+        parts.extend(rng.sample(filler, 12))
+        parts.append(rng.choice(skill_taxonomy.get_taxonomy().skills) + ",")
+    return " ".join(parts[:words])
+
+
+def extract_skills_substring(text, skills_list, nlp=None):
+    """The previous extract_skills: a spaCy parse, then a substring test per skill."""
+    lowered = nlp(text.lower()).text if nlp else text.lower()
+    return [skill for skill in skills_list if skill.lower() in lowered]
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [200, 1000, 5000]
+    taxonomy = skill_taxonomy.get_taxonomy()
+    skills = taxonomy.skills
+    nlp = model_registry.get_nlp()
+    if not nlp:
+        print("spaCy model not available; timing the substring scan without the parse")
+
+    start = time.perf_counter()
+    matcher = skill_matcher.SkillMatcher(skills, taxonomy.aliases)
+    print(f"Compiled {len(skills)} skills in {(time.perf_counter() - start) * 1000:.1f} ms (once per process)")
+
+    spacy_matcher = None
+    tokenizer_nlp = model_registry.get_tokenizer_nlp()
+    if tokenizer_nlp:
+        start = time.perf_counter()
+        spacy_matcher = skill_matcher.SpacySkillMatcher(skills, taxonomy.aliases, tokenizer_nlp)
+        print(f"Built the spaCy tokenizer matcher in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    print(f"\n{'words':>6} {'substring ms':>13} {'regex ms':>9} {'speedup':>8} {'spacy tok ms':>13} "
+          f"{'speedup':>8} {'found old/regex/spacy':>22}")
+    for size in sizes:
+        text = make_cv(size)
+        repeat = max(1, 2000 // size)
+        old_seconds, old = timed(lambda: extract_skills_substring(text, skills, nlp), repeat)
+        new_seconds, new = timed(lambda: matcher.skills_in(text), repeat)
+        spacy_column, spacy_found = f"{'-':>13} {'-':>8}", "-"
+        if spacy_matcher:
+            spacy_seconds, found = timed(lambda: spacy_matcher.skills_in(text), repeat)
+            spacy_column = f"{spacy_seconds * 1000:>13.2f} {old_seconds / spacy_seconds:>7.1f}x"
+            spacy_found = len(found)
+        print(f"{size:>6} {old_seconds * 1000:>13.2f} {new_seconds * 1000:>9.2f} "
+              f"{old_seconds / new_seconds:>7.1f}x {spacy_column} "
+              f"{f'{len(set(old))}/{len(new)}/{spacy_found}':>22}")
+
+    # Skills the substring scan reports only because they occur inside other words
+    text = make_cv(1000)
+    false_hits = sorted(set(extract_skills_substring(text, skills)) - set(matcher.skills_in(text)))
+    print(f"\nSubstring-only matches on the 1000-word CV (mostly inside other words): {', '.join(false_hits)}")
+
+
+if __name__ == "__main__":
+    main()
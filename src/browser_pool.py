@@ -0,0 +1,162 @@
+# A bounded pool of warm headless Chrome drivers for the Selenium scrapers (Naukri), recycled
+# after BROWSER_MAX_USES pages or on failure.
+import atexit
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+
+import chromedriver
+import config
+
+
+class BrowserPoolTimeout(Exception):
+    """Raised when no browser becomes free within the acquire timeout."""
+
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created = time.time()
+
+
+def create_driver():
+    """Launch a new headless Chrome WebDriver."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument('--log-level=3')
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    if config.CHROME_BINARY:
+        chrome_options.binary_location = config.CHROME_BINARY
+    service = Service(chromedriver.get_driver_path())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.set_page_load_timeout(config.BROWSER_PAGE_LOAD_TIMEOUT)
+    return driver
+
+
+def wait_for_selector(driver, css_selector, timeout=None):
+    """Wait until css_selector matches an element; returns False (instead of raising) on timeout."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    timeout = config.BROWSER_WAIT_SECONDS if timeout is None else timeout
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, css_selector)))
+        return True
+    except TimeoutException:
+        return False
+
+
+class BrowserPool:
+    """A bounded pool of warm WebDriver instances."""
+
+    def __init__(self, max_browsers=None, max_uses=None, factory=create_driver):
+        self.max_browsers = max_browsers or config.BROWSER_POOL_SIZE
+        self.max_uses = max_uses or config.BROWSER_MAX_USES
+        self._factory = factory
+        self._slots = threading.BoundedSemaphore(self.max_browsers)
+        self._idle = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {'launched': 0, 'reused': 0, 'recycled': 0, 'discarded': 0, 'launch_seconds': 0.0}
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Check out a driver for the duration of the with block.
+
+        A driver whose block raised is quit rather than returned, in case the
+        browser itself is in a bad state.
+        """
+        timeout = config.BROWSER_ACQUIRE_TIMEOUT if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise BrowserPoolTimeout(f"No browser free within {timeout:g}s")
+        pooled = None
+        try:
+            pooled = self._checkout()
+            yield pooled.driver
+        except Exception:
+            if pooled is not None:
+                self._quit(pooled, 'discarded')
+                pooled = None
+            raise
+        finally:
+            if pooled is not None:
+                self._checkin(pooled)
+            self._slots.release()
+
+    def _checkout(self):
+        with self._lock:
+            if self._idle:
+                self._stats['reused'] += 1
+                return self._idle.pop()
+        start = time.perf_counter()
+        pooled = _PooledDriver(self._factory())
+        seconds = time.perf_counter() - start
+        with self._lock:
+            self._stats['launched'] += 1
+            self._stats['launch_seconds'] += seconds
+        print(f"Launched a headless browser in {seconds:.1f}s")
+        return pooled
+
+    def _checkin(self, pooled):
+        pooled.uses += 1
+        if pooled.uses >= self.max_uses:
+            self._quit(pooled, 'recycled')
+            return
+        with self._lock:
+            if not self._closed:
+                self._idle.append(pooled)
+                return
+        self._quit(pooled, 'discarded')
+
+    def _quit(self, pooled, reason):
+        with self._lock:
+            self._stats[reason] += 1
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            print(f"Error closing browser: {e}")
+
+    def close(self):
+        """Quit all idle browsers; drivers still checked out are quit when returned."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            try:
+                pooled.driver.quit()
+            except Exception:
+                print(traceback.format_exc())
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, idle=len(self._idle), max_browsers=self.max_browsers,
+                        max_uses=self.max_uses)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide BrowserPool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool()
+                atexit.register(_pool.close)
+    return _pool
+
+
+def stats():
+    return _pool.stats() if _pool is not None else {'launched': 0}
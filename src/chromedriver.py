@@ -0,0 +1,185 @@
+# Resolves chromedriver once and records it per Chrome major version under CACHE_DIR/chromedriver.
+#
+#   python chromedriver.py   # resolve ahead of time, e.g. at image build for offline use
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+import traceback
+
+import config
+
+CHROME_BINARIES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+MANIFEST_NAME = "manifest.json"
+
+_driver_path = None
+_driver_lock = threading.Lock()
+_warm_thread = None
+_warm_lock = threading.Lock()
+
+
+class ChromedriverUnavailableError(Exception):
+    """Raised when no usable chromedriver can be found (or downloaded)."""
+
+
+def driver_dir():
+    return os.path.join(config.CACHE_DIR, "chromedriver")
+
+
+def _major_version(output):
+    match = re.search(r"(\d+)\.\d+", output or "")
+    return int(match.group(1)) if match else None
+
+
+def _version_output(binary):
+    try:
+        return subprocess.run([binary, '--version'], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def chrome_major_version():
+    """Major version of the installed Chrome/Chromium, or None if it can't be determined."""
+    candidates = [config.CHROME_BINARY] if config.CHROME_BINARY else []
+    candidates += [shutil.which(name) for name in CHROME_BINARIES]
+    for binary in candidates:
+        if binary:
+            version = _major_version(_version_output(binary))
+            if version:
+                return version
+    return None
+
+
+def _usable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def read_manifest():
+    try:
+        with open(os.path.join(driver_dir(), MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(path, chrome_version):
+    os.makedirs(driver_dir(), exist_ok=True)
+    manifest = {'path': path, 'chrome_major': chrome_version,
+                'driver_major': _major_version(_version_output(path)), 'resolved_at': time.time()}
+    tmp_path = os.path.join(driver_dir(), MANIFEST_NAME + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(driver_dir(), MANIFEST_NAME))
+    return manifest
+
+
+def _fits(manifest, chrome_version):
+    """False when the recorded driver was built for a different Chrome major version than the installed one."""
+    if chrome_version is None:
+        return True
+    driver_major = manifest.get('driver_major')
+    if driver_major is None:
+        # Older manifests only know the Chrome version the driver was resolved for
+        driver_major = manifest.get('chrome_major')
+    return driver_major is None or driver_major == chrome_version
+
+
+def _download():
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    try:
+        from webdriver_manager.core.driver_cache import DriverCacheManager
+        manager = ChromeDriverManager(cache_manager=DriverCacheManager(root_dir=driver_dir()))
+    except ImportError:
+        # webdriver-manager 3.x
+        manager = ChromeDriverManager(path=driver_dir())
+    return manager.install()
+
+
+def resolve(force=False):
+    """Find a chromedriver binary, downloading one only when the recorded driver doesn't fit."""
+    if config.CHROMEDRIVER_PATH:
+        if not _usable(config.CHROMEDRIVER_PATH):
+            raise ChromedriverUnavailableError(f"CVISION_CHROMEDRIVER is not an executable file: "
+                                               f"{config.CHROMEDRIVER_PATH}")
+        print(f"Using configured chromedriver {config.CHROMEDRIVER_PATH}")
+        return config.CHROMEDRIVER_PATH
+
+    manifest = read_manifest()
+    recorded = manifest.get('path') if manifest else None
+    chrome_version = chrome_major_version()
+    if config.CHROMEDRIVER_OFFLINE:
+        if not _usable(recorded):
+            raise ChromedriverUnavailableError("Offline mode and no recorded chromedriver in "
+                                               f"{driver_dir()}; set CVISION_CHROMEDRIVER or run chromedriver.py")
+        if not _fits(manifest, chrome_version):
+            raise ChromedriverUnavailableError(f"Recorded chromedriver {recorded} is version "
+                                               f"{manifest.get('driver_major') or manifest.get('chrome_major')} but Chrome is version "
+                                               f"{chrome_version}; run chromedriver.py again or set "
+                                               "CVISION_CHROMEDRIVER")
+        print(f"Using recorded chromedriver {recorded} (offline)")
+        return recorded
+
+    if not force and _usable(recorded):
+        if _fits(manifest, chrome_version):
+            print(f"Using recorded chromedriver {recorded}")
+            return recorded
+        print(f"Chrome is version {chrome_version} but the recorded chromedriver is version "
+              f"{manifest.get('driver_major') or manifest.get('chrome_major')}, resolving chromedriver again")
+
+    start = time.perf_counter()
+    try:
+        path = _download()
+    except Exception as e:
+        if _usable(recorded):
+            print(f"Could not resolve chromedriver ({e}), keeping the recorded {recorded}")
+            if not _fits(manifest, chrome_version):
+                print(f"Warning: {recorded} does not match Chrome version {chrome_version}; "
+                      "starting a browser will likely fail")
+            return recorded
+        raise ChromedriverUnavailableError(f"Could not resolve chromedriver: {e}") from e
+    _write_manifest(path, chrome_version)
+    print(f"Resolved chromedriver {path} in {time.perf_counter() - start:.1f}s")
+    return path
+
+
+def get_driver_path():
+    """Return the chromedriver path, resolving it once per process."""
+    global _driver_path
+    if _driver_path is None:
+        with _driver_lock:
+            if _driver_path is None:
+                _driver_path = resolve()
+    return _driver_path
+
+
+def _warm():
+    try:
+        get_driver_path()
+    except ChromedriverUnavailableError as e:
+        # Not fatal: Naukri scraping fails on its own, everything else works
+        print(f"chromedriver not available: {e}")
+    except Exception as e:
+        print(f"Error resolving chromedriver: {e}")
+        print(traceback.format_exc())
+
+
+def warm_in_background():
+    """Start resolving the driver in a daemon thread (once per process); returns immediately.
+
+    A search that needs the driver before this finishes waits for the same
+    resolution instead of starting another.
+    """
+    global _warm_thread
+    with _warm_lock:
+        if _warm_thread is None and _driver_path is None:
+            _warm_thread = threading.Thread(target=_warm, name="chromedriver-warmup", daemon=True)
+            _warm_thread.start()
+
+
+if __name__ == "__main__":
+    path = resolve(force=not config.CHROMEDRIVER_OFFLINE and not config.CHROMEDRIVER_PATH)
+    print(json.dumps(read_manifest() or {'path': path}, indent=2))
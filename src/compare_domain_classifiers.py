@@ -0,0 +1,152 @@
+# Accuracy/latency comparison of the domain classifiers.
+#
+#   python compare_domain_classifiers.py                      # built-in samples
+#   python compare_domain_classifiers.py --data labeled.jsonl # {"text"|"path": ..., "label": ...} per line
+#   python compare_domain_classifiers.py --data cvs/          # cvs/<label>/<cv files>
+import argparse
+import json
+import os
+import statistics
+import time
+
+import config
+import cv_labels
+import domain_classifier
+import model_registry
+
+SAMPLES = [
+    ("Data Science", "Data scientist with 4 years of experience building churn and demand forecasting models. "
+                     "Python, pandas, SQL, scikit-learn, A/B testing and statistical analysis; dashboards in Tableau."),
+    ("Frontend Development", "Frontend developer building responsive single page applications with React, TypeScript, "
+                             "Redux and Tailwind CSS. Focus on accessibility, web performance and design systems."),
+    ("DevOps Engineering", "DevOps engineer maintaining CI/CD pipelines in GitHub Actions and Jenkins, Kubernetes "
+                           "clusters on AWS, Terraform modules, Prometheus and Grafana monitoring, on-call rotations."),
+    ("Mobile App Development", "Android and iOS developer. Shipped five apps with Kotlin, Swift and Flutter, push "
+                               "notifications, offline sync and App Store releases."),
+    ("Accounting", "Chartered accountant handling month-end close, reconciliations, statutory audits, GST and "
+                   "income tax filings, and preparing financial statements for SMEs."),
+    ("Human Resources", "HR generalist managing end-to-end recruitment, onboarding, employee engagement programs, "
+                        "payroll coordination and performance review cycles for 300 employees."),
+    ("Digital Marketing", "Digital marketer running Google Ads and Meta campaigns, SEO audits, email automation in "
+                          "HubSpot and reporting in Google Analytics; grew organic traffic 3x."),
+    ("Cybersecurity", "Security analyst performing penetration tests and vulnerability assessments, SIEM monitoring, "
+                      "incident response and OWASP secure code reviews."),
+    ("UI/UX Design", "Product designer running user research and usability tests, creating wireframes, prototypes "
+                     "and high-fidelity UI in Figma, maintaining the design system."),
+    ("Sales", "Account executive closing B2B SaaS deals, prospecting and qualifying leads, negotiating contracts "
+              "and exceeding quarterly quota by 120%."),
+    ("Healthcare", "Registered nurse with ICU experience: patient assessment, medication administration, care "
+                   "plans and coordination with physicians."),
+    ("Education", "High school mathematics teacher designing curriculum and lesson plans, mentoring students and "
+                  "running after-school coding clubs."),
+]
+
+
+def load_folder(folder):
+    import utils
+    from batch_ingest import LocalUpload, SUPPORTED_EXTENSIONS
+
+    samples = []
+    for label in sorted(os.listdir(folder)):
+        label_dir = os.path.join(folder, label)
+        if not os.path.isdir(label_dir):
+            continue
+        for name in sorted(os.listdir(label_dir)):
+            path = os.path.join(label_dir, name)
+            if name.lower().endswith('.txt'):
+                with open(path, encoding='utf-8') as f:
+                    samples.append((label, f.read()))
+            elif name.lower().endswith(SUPPORTED_EXTENSIONS):
+                text = utils.extract_text(LocalUpload(path))
+                if not utils.is_extraction_error(text):
+                    samples.append((label, text))
+    return samples
+
+
+def load_jsonl(path):
+    import utils
+    from batch_ingest import LocalUpload
+
+    samples = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            text = record.get('text')
+            if text is None:
+                text = utils.extract_text(LocalUpload(record['path']))
+            samples.append((record['label'], text))
+    return samples
+
+
+def rank_zero_shot(text, labels):
+    return model_registry.get_classifier()(text, labels)['labels']
+
+
+def rank_zero_shot_chunked(text, labels):
+    return [label for label, _ in domain_classifier.classify_zero_shot(text, labels)]
+
+
+def rank_embedding(text, labels):
+    return [label for label, _ in domain_classifier.classify(text, labels)]
+
+
+def evaluate(name, rank, samples, labels):
+    # Warm up (model load and label prototypes) outside the timings
+    rank(samples[0][1], labels)
+    latencies = []
+    top1 = top3 = 0
+    for label, text in samples:
+        start = time.perf_counter()
+        ranked = rank(text, labels)
+        latencies.append(time.perf_counter() - start)
+        top1 += ranked[0] == label
+        top3 += label in ranked[:3]
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"{name:<12} {top1 / len(samples):>8.1%} {top3 / len(samples):>8.1%} "
+          f"{statistics.mean(latencies) * 1000:>9.1f} {p95 * 1000:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare zero-shot and embedding domain classification.")
+    parser.add_argument('--data', help="labeled JSONL file or folder of <label>/<cv> files (default: built-in samples)")
+    args = parser.parse_args()
+
+    if not args.data:
+        samples = SAMPLES
+    elif os.path.isdir(args.data):
+        samples = load_folder(args.data)
+    else:
+        samples = load_jsonl(args.data)
+    if not samples:
+        print("No samples to evaluate")
+        return
+    labels = list(cv_labels.DOMAIN_LABELS)
+    for label in sorted({label for label, _ in samples} - set(labels)):
+        print(f"Note: '{label}' is not a candidate label; those samples can't be classified correctly")
+
+    # Measure encoding, not the embedding cache (a repeat run would otherwise time cache hits)
+    config.EMBEDDING_CACHE_ENABLED = False
+
+    print(f"{len(samples)} samples, {len(labels)} candidate labels\n")
+    print(f"{'classifier':<12} {'top-1':>8} {'top-3':>8} {'mean ms':>9} {'p95 ms':>8}")
+    if model_registry.get_classifier():
+        evaluate('zero_shot', rank_zero_shot, samples, labels)
+        evaluate('zs_chunked', rank_zero_shot_chunked, samples, labels)
+    else:
+        print("zero_shot    (pipeline not available)")
+    if model_registry.get_similarity_model():
+        evaluate('embedding', rank_embedding, samples, labels)
+    else:
+        print("embedding    (SentenceTransformer not available)")
+
+    print("\nModel load times (not included above):")
+    for name, status in model_registry.registry.status().items():
+        if status['state'] != 'not loaded':
+            print(f"  {status['description']}: {status['state']}, {status.get('load_seconds', 0):.1f}s")
+
+
+if __name__ == "__main__":
+    main()
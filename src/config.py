@@ -0,0 +1,132 @@
+# Runtime settings for CVision, read from the environment (or the .env file
+# loaded by main.py). Every setting has a default so nothing here is required.
+import os
+
+try:
+    from dotenv import load_dotenv
+    # main.py loads .env too, but config may be imported first (or by scripts)
+    load_dotenv()
+except ImportError:
+    pass
+
+
+def _env_bool(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        print(f"Invalid value for {name}, using default {default}")
+        return default
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        print(f"Invalid value for {name}, using default {default}")
+        return default
+
+
+# Local caches (embeddings and other derived data)
+CACHE_DIR = os.path.expanduser(os.environ.get("CVISION_CACHE_DIR", os.path.join("~", ".cache", "cvision")))
+
+# Job scraping
+SCRAPE_DEADLINE_SECONDS = _env_float("CVISION_SCRAPE_DEADLINE", 45)
+SCRAPE_MAX_WORKERS = _env_int("CVISION_SCRAPE_MAX_WORKERS", 6)
+# Headless browsers (Naukri): pool size, pages per browser before it is replaced,
+# seconds to wait for a free browser, for results to appear and for a page load
+BROWSER_POOL_SIZE = _env_int("CVISION_BROWSER_POOL_SIZE", 2)
+BROWSER_MAX_USES = _env_int("CVISION_BROWSER_MAX_USES", 20)
+BROWSER_ACQUIRE_TIMEOUT = _env_float("CVISION_BROWSER_ACQUIRE_TIMEOUT", 30)
+BROWSER_WAIT_SECONDS = _env_float("CVISION_BROWSER_WAIT", 10)
+BROWSER_PAGE_LOAD_TIMEOUT = _env_float("CVISION_BROWSER_PAGE_LOAD_TIMEOUT", 30)
+# chromedriver: a preinstalled binary to use as is, offline mode (never download; use the
+# driver recorded under CACHE_DIR/chromedriver) and the Chrome binary to use
+CHROMEDRIVER_PATH = os.environ.get("CVISION_CHROMEDRIVER") or None
+CHROMEDRIVER_OFFLINE = _env_bool("CVISION_CHROMEDRIVER_OFFLINE", False)
+CHROME_BINARY = os.environ.get("CVISION_CHROME_BINARY") or None
+# Scraping backend: 'threads' (requests in a thread pool) or 'async' (httpx on one event loop)
+SCRAPE_BACKEND = os.environ.get("CVISION_SCRAPE_BACKEND", "threads").strip().lower()
+# Async backend: total connections and idle keep-alive connections in its pool
+ASYNC_MAX_CONNECTIONS = _env_int("CVISION_ASYNC_MAX_CONNECTIONS", 100)
+ASYNC_MAX_KEEPALIVE = _env_int("CVISION_ASYNC_MAX_KEEPALIVE", 20)
+
+# Shared HTTP session: request timeout, retries (with exponential backoff) and keep-alive pools
+HTTP_TIMEOUT_SECONDS = _env_float("CVISION_HTTP_TIMEOUT", 20)
+HTTP_RETRIES = _env_int("CVISION_HTTP_RETRIES", 2)
+HTTP_RETRY_BACKOFF = _env_float("CVISION_HTTP_RETRY_BACKOFF", 0.5)
+HTTP_POOL_HOSTS = _env_int("CVISION_HTTP_POOL_HOSTS", 20)
+HTTP_POOL_SIZE = _env_int("CVISION_HTTP_POOL_SIZE", 16)
+
+# Job description fetching (match_jobs)
+DESCRIPTION_FETCH_DEADLINE_SECONDS = _env_float("CVISION_DESCRIPTION_DEADLINE", 60)
+DESCRIPTION_FETCH_MAX_WORKERS = _env_int("CVISION_DESCRIPTION_MAX_WORKERS", 16)
+DESCRIPTION_FETCH_PER_HOST = _env_int("CVISION_DESCRIPTION_PER_HOST", 4)
+
+# Embeddings
+EMBEDDING_BATCH_SIZE = _env_int("CVISION_EMBEDDING_BATCH_SIZE", 64)
+EMBEDDING_CACHE_ENABLED = _env_bool("CVISION_EMBEDDING_CACHE", True)
+EMBEDDING_CACHE_MAX_ENTRIES = _env_int("CVISION_EMBEDDING_CACHE_MAX_ENTRIES", 50000)
+
+# Gemini
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY") or None
+GEMINI_MODEL_TTL_SECONDS = _env_float("CVISION_GEMINI_MODEL_TTL", 3600)
+GEMINI_REQUESTS_PER_MINUTE = _env_int("CVISION_GEMINI_RPM", 15)
+GEMINI_TOKENS_PER_MINUTE = _env_int("CVISION_GEMINI_TPM", 1000000)
+GEMINI_MAX_CONCURRENCY = _env_int("CVISION_GEMINI_MAX_CONCURRENCY", 4)
+GEMINI_MAX_RETRIES = _env_int("CVISION_GEMINI_MAX_RETRIES", 4)
+GEMINI_BACKOFF_SECONDS = _env_float("CVISION_GEMINI_BACKOFF", 2)
+GEMINI_ANALYZE_TOP_K = _env_int("CVISION_GEMINI_TOP_K", 10)
+# Ranked jobs shown per results page (jobs past the top-K get an "Analyze" button)
+JOBS_PER_PAGE = _env_int("CVISION_JOBS_PER_PAGE", 10)
+GEMINI_CACHE_ENABLED = _env_bool("CVISION_GEMINI_CACHE", True)
+GEMINI_CACHE_TTL_SECONDS = _env_float("CVISION_GEMINI_CACHE_TTL", 7 * 24 * 3600)
+GEMINI_CACHE_MAX_BYTES = _env_int("CVISION_GEMINI_CACHE_MAX_BYTES", 100 * 1024 * 1024)
+
+# OCR for image-based PDFs
+OCR_RESOLUTION = _env_int("CVISION_OCR_RESOLUTION", 300)
+# Pages are tried at OCR_MIN_RESOLUTION first and re-rendered at OCR_RESOLUTION
+# only when Tesseract's mean word confidence is below OCR_MIN_CONFIDENCE
+OCR_MIN_RESOLUTION = _env_int("CVISION_OCR_MIN_RESOLUTION", 150)
+OCR_MIN_CONFIDENCE = _env_float("CVISION_OCR_MIN_CONFIDENCE", 75)
+OCR_PREPROCESS = _env_bool("CVISION_OCR_PREPROCESS", True)
+OCR_MAX_WORKERS = _env_int("CVISION_OCR_MAX_WORKERS", max(1, (os.cpu_count() or 2) - 1))
+OCR_MAX_IN_FLIGHT = _env_int("CVISION_OCR_MAX_IN_FLIGHT", 4)
+# A PDF page whose text layer has fewer non-whitespace characters than this is OCR'd
+OCR_PAGE_MIN_CHARS = _env_int("CVISION_OCR_PAGE_MIN_CHARS", 20)
+
+# Extracted CV text, keyed by file content
+EXTRACTION_CACHE_ENABLED = _env_bool("CVISION_EXTRACTION_CACHE", True)
+EXTRACTION_CACHE_MAX_BYTES = _env_int("CVISION_EXTRACTION_CACHE_MAX_BYTES", 50 * 1024 * 1024)
+EXTRACTION_MEMORY_ENTRIES = _env_int("CVISION_EXTRACTION_MEMORY_ENTRIES", 32)
+
+# Upload limits: larger files are rejected, pages after PDF_MAX_PAGES are not extracted
+MAX_UPLOAD_BYTES = _env_int("CVISION_MAX_UPLOAD_BYTES", 20 * 1024 * 1024)
+PDF_MAX_PAGES = _env_int("CVISION_PDF_MAX_PAGES", 50)
+
+# Skill extraction: 'regex' (compiled word-boundary matcher) or 'spacy' (tokenizer-only spaCy PhraseMatcher)
+SKILL_MATCHER = os.environ.get("CVISION_SKILL_MATCHER", "regex").strip().lower()
+# Skill taxonomy JSON file (default: skills_taxonomy.json next to the code)
+SKILL_TAXONOMY_PATH = os.environ.get("CVISION_SKILL_TAXONOMY") or None
+# extract_skills_batch: nlp.pipe worker processes (spaCy matcher only) and texts per batch
+SKILL_BATCH_PROCESSES = _env_int("CVISION_SKILL_BATCH_PROCESSES", 1)
+SKILL_BATCH_SIZE = _env_int("CVISION_SKILL_BATCH_SIZE", 64)
+
+# Domain classification: 'zero_shot' (BART MNLI) or 'embedding' (MiniLM label prototypes)
+DOMAIN_CLASSIFIER = os.environ.get("CVISION_DOMAIN_CLASSIFIER", "zero_shot").strip().lower()
+# Embedding classifier: softmax temperature over cosine similarities, CV chunk size and chunk cap
+DOMAIN_EMBEDDING_TEMPERATURE = _env_float("CVISION_DOMAIN_EMBEDDING_TEMPERATURE", 0.05)
+DOMAIN_EMBEDDING_CHUNK_WORDS = _env_int("CVISION_DOMAIN_EMBEDDING_CHUNK_WORDS", 150)
+DOMAIN_EMBEDDING_MAX_CHUNKS = _env_int("CVISION_DOMAIN_EMBEDDING_MAX_CHUNKS", 16)
+# Zero-shot classifier: classify long CVs in token-bounded segments (batched) instead of truncating them.
+# Off by default: every segment is a full pipeline pass, so a long CV costs several times as much
+DOMAIN_ZERO_SHOT_CHUNKING = _env_bool("CVISION_DOMAIN_ZERO_SHOT_CHUNKING", False)
+DOMAIN_ZERO_SHOT_CHUNK_TOKENS = _env_int("CVISION_DOMAIN_ZERO_SHOT_CHUNK_TOKENS", 0)
+DOMAIN_ZERO_SHOT_MAX_CHUNKS = _env_int("CVISION_DOMAIN_ZERO_SHOT_MAX_CHUNKS", 8)
+DOMAIN_ZERO_SHOT_BATCH_SIZE = _env_int("CVISION_DOMAIN_ZERO_SHOT_BATCH_SIZE", 8)
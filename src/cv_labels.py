@@ -0,0 +1,56 @@
+# Candidate domains for CV classification. Shared by the Streamlit app and the
+# batch ingestion CLI; the skills looked for in CVs are in skills_taxonomy.json.
+
+DOMAIN_LABELS = [
+    # Technical Domains
+    "Software Engineering", "Data Science", "Machine Learning", "Artificial Intelligence",
+    "Backend Development", "Frontend Development", "Full Stack Development",
+    "DevOps Engineering", "Cloud Computing", "Mobile App Development",
+    "Game Development", "Cybersecurity", "Database Administration", "UI/UX Design",
+    "Blockchain Development", "IoT Development", "Embedded Systems", "QA Engineering",
+
+    # Business Domains
+    "Marketing", "Digital Marketing", "Content Creation", "Sales", "Finance",
+    "Accounting", "Human Resources", "Operations", "Project Management",
+    "Product Management", "Business Analysis", "Customer Support",
+    "Supply Chain Management", "E-commerce", "Healthcare", "Education"
+]
+
+# Short descriptions of each domain, used to build the label prototypes for the
+# embedding-based domain classifier (domain_classifier.py)
+DOMAIN_DESCRIPTIONS = {
+    "Software Engineering": "software engineer designing, building and testing applications, code reviews, algorithms",
+    "Data Science": "data scientist analysing data with statistics, Python, pandas, SQL and predictive models",
+    "Machine Learning": "machine learning engineer training and deploying models with scikit-learn, TensorFlow or PyTorch",
+    "Artificial Intelligence": "AI engineer working on deep learning, NLP, computer vision, LLMs and generative AI",
+    "Backend Development": "backend developer building APIs, microservices and databases with Node.js, Django, Java or Go",
+    "Frontend Development": "frontend developer building web interfaces with HTML, CSS, JavaScript, React or Angular",
+    "Full Stack Development": "full stack developer working on both frontend and backend of web applications",
+    "DevOps Engineering": "DevOps engineer automating CI/CD pipelines, Docker, Kubernetes, infrastructure as code",
+    "Cloud Computing": "cloud engineer designing infrastructure on AWS, Azure or GCP, serverless and networking",
+    "Mobile App Development": "mobile developer building Android and iOS apps with Kotlin, Swift, Flutter or React Native",
+    "Game Development": "game developer working with Unity or Unreal Engine, gameplay programming, 3D graphics",
+    "Cybersecurity": "security engineer doing penetration testing, network security, vulnerability assessment",
+    "Database Administration": "database administrator managing SQL databases, backups, performance tuning, replication",
+    "UI/UX Design": "UI/UX designer doing user research, wireframes, prototypes and visual design in Figma",
+    "Blockchain Development": "blockchain developer writing smart contracts in Solidity for Ethereum, Web3 and DeFi",
+    "IoT Development": "IoT developer connecting sensors and devices, firmware, MQTT and edge computing",
+    "Embedded Systems": "embedded engineer programming microcontrollers in C, real-time operating systems, hardware",
+    "QA Engineering": "QA engineer writing manual and automated tests with Selenium, test plans and bug tracking",
+    "Marketing": "marketing professional planning campaigns, brand strategy, market research and positioning",
+    "Digital Marketing": "digital marketer running SEO, SEM, social media, email marketing and analytics",
+    "Content Creation": "content creator writing articles, copywriting, video production and social media content",
+    "Sales": "sales professional generating leads, negotiating deals, managing accounts and hitting quotas",
+    "Finance": "finance professional doing financial analysis, budgeting, forecasting and investment",
+    "Accounting": "accountant handling bookkeeping, audits, taxation, financial statements and reconciliations",
+    "Human Resources": "HR professional handling recruitment, onboarding, employee relations and payroll",
+    "Operations": "operations manager improving processes, logistics, scheduling and day-to-day business operations",
+    "Project Management": "project manager planning schedules, budgets, risks and stakeholders, Agile and Scrum",
+    "Product Management": "product manager defining roadmaps, user stories and priorities with engineering teams",
+    "Business Analysis": "business analyst gathering requirements, process modelling and reporting for stakeholders",
+    "Customer Support": "customer support agent resolving tickets, helpdesk, customer service and satisfaction",
+    "Supply Chain Management": "supply chain professional managing procurement, inventory, logistics and vendors",
+    "E-commerce": "e-commerce professional running online stores, Shopify, catalog, conversions and marketplaces",
+    "Healthcare": "healthcare professional such as nurse, doctor or pharmacist providing patient care",
+    "Education": "educator teaching students, curriculum design, lesson planning and training",
+}
@@ -0,0 +1,161 @@
+# Small SQLite-backed key/value cache with LRU eviction, optional TTL and
+# hit/miss counters, shared by the persistent caches (each *_cache module's
+# get_cache() opens its own database file). Cache failures are never fatal: a
+# broken or locked database just behaves like a miss.
+import os
+import sqlite3
+import threading
+import time
+import traceback
+
+
+class DiskCache:
+    """Persistent bytes cache bounded by entry count and/or total size."""
+
+    def __init__(self, path, max_entries=None, max_bytes=None, ttl_seconds=None, name=None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.name = name or os.path.basename(path)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            self._conn = conn
+        return self._conn
+
+    def _expired(self, created_at, now):
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get_many(self, keys):
+        """Return {key: value} for the keys that are cached and not expired."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        found = {}
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                expired = []
+                # Stay well below SQLite's bound-parameter limit
+                for i in range(0, len(keys), 500):
+                    chunk = keys[i:i + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, value, created_at FROM entries WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                    for key, value, created_at in rows:
+                        if self._expired(created_at, now):
+                            expired.append(key)
+                        else:
+                            found[key] = bytes(value)
+                if found:
+                    conn.executemany("UPDATE entries SET accessed_at = ? WHERE key = ?",
+                                     [(now, key) for key in found])
+                if expired:
+                    conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in expired])
+                    self.evictions += len(expired)
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error reading {self.name} cache: {str(e)}")
+                found = {}
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def set_many(self, items):
+        """Store {key: bytes} and evict least recently used entries beyond the limits."""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    [(key, sqlite3.Binary(value), len(value), now, now) for key, value in items.items()],
+                )
+                self._evict(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error writing {self.name} cache: {str(e)}")
+                print(traceback.format_exc())
+
+    def set(self, key, value):
+        self.set_many({key: value})
+
+    def _evict(self, conn):
+        if self.max_entries is not None:
+            count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN"
+                    " (SELECT key FROM entries ORDER BY accessed_at ASC LIMIT ?)", (excess,)
+                )
+                self.evictions += excess
+        if self.max_bytes is not None:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                doomed = []
+                for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at ASC"):
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+                self.evictions += len(doomed)
+
+    def clear(self):
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("DELETE FROM entries")
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error clearing {self.name} cache: {str(e)}")
+
+    def stats(self):
+        """Return hit/miss/eviction counters and the current size of the cache."""
+        entries, total_bytes = 0, 0
+        with self._lock:
+            try:
+                entries, total_bytes = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"Error reading {self.name} cache stats: {str(e)}")
+        lookups = self.hits + self.misses
+        return {
+            'name': self.name,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': total_bytes,
+        }
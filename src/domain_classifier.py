@@ -0,0 +1,232 @@
+# Domain classification beyond a single zero-shot call.
+#
+# The default get_domain runs facebook/bart-large-mnli zero-shot, which is one
+# NLI forward pass of a 400M-parameter model per candidate label, on a CV the
+# pipeline silently truncates to the model's maximum length.
+#
+# classify() is an alternative that uses the all-MiniLM-L6-v2
+# SentenceTransformer the app already loads for job matching: every label gets
+# a prototype embedding (its name, a resume-style sentence and its description
+# from cv_labels), computed once per label set, and a CV is assigned to the
+# nearest prototype. Long CVs are embedded in chunks (MiniLM only reads the
+# first 256 tokens of a text) and the chunk embeddings averaged. Select it
+# with CVISION_DOMAIN_CLASSIFIER=embedding.
+#
+# classify_zero_shot() keeps the NLI model but splits long CVs into
+# token-bounded segments that fit next to the longest label hypothesis,
+# classifies all segments in one batched pipeline call and averages the
+# scores, so the whole CV is read and no segment is truncated.
+import threading
+
+import numpy as np
+
+import config
+import cv_labels
+import embedding_cache
+import model_registry
+
+_prototypes = {}
+_prototypes_lock = threading.Lock()
+
+
+def _normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def prototype_texts(label, descriptions=None):
+    descriptions = cv_labels.DOMAIN_DESCRIPTIONS if descriptions is None else descriptions
+    texts = [label, f"Resume of a professional working in {label}."]
+    if descriptions.get(label):
+        texts.append(f"Resume of a {descriptions[label]}.")
+    return texts
+
+
+def label_prototypes(labels, model=None):
+    """Return a (labels, dim) matrix of unit-length label prototypes, computed once per label set."""
+    key = tuple(labels)
+    prototypes = _prototypes.get(key)
+    if prototypes is not None:
+        return prototypes
+    with _prototypes_lock:
+        prototypes = _prototypes.get(key)
+        if prototypes is None:
+            texts = [prototype_texts(label) for label in labels]
+            flat = [text for label_texts in texts for text in label_texts]
+            embeddings = _normalize(embedding_cache.encode_texts(flat, model=model))
+            rows = []
+            offset = 0
+            for label_texts in texts:
+                rows.append(embeddings[offset:offset + len(label_texts)].mean(axis=0))
+                offset += len(label_texts)
+            prototypes = _normalize(np.vstack(rows))
+            _prototypes[key] = prototypes
+    return prototypes
+
+
+def chunk_text(text, words_per_chunk=None, max_chunks=None):
+    """Split text into chunks of about words_per_chunk words (at most max_chunks, spread evenly)."""
+    words_per_chunk = words_per_chunk or config.DOMAIN_EMBEDDING_CHUNK_WORDS
+    max_chunks = max_chunks or config.DOMAIN_EMBEDDING_MAX_CHUNKS
+    words = text.split()
+    chunks = [" ".join(words[i:i + words_per_chunk]) for i in range(0, len(words), words_per_chunk)]
+    if len(chunks) > max_chunks:
+        step = len(chunks) / max_chunks
+        chunks = [chunks[int(i * step)] for i in range(max_chunks)]
+    return chunks
+
+
+def document_embedding(text, model=None):
+    """Unit-length embedding of a whole document: the mean of its chunk embeddings."""
+    return document_embeddings([text], model)[0]
+
+
+def document_embeddings(texts, model=None):
+    """document_embedding for many documents, with all their chunks encoded in one call."""
+    chunked = [chunk_text(text) or [text] for text in texts]
+    flat = [chunk for chunks in chunked for chunk in chunks]
+    embeddings = _normalize(embedding_cache.encode_texts(flat, model=model))
+    rows = []
+    offset = 0
+    for chunks in chunked:
+        rows.append(embeddings[offset:offset + len(chunks)].mean(axis=0))
+        offset += len(chunks)
+    return _normalize(np.vstack(rows))
+
+
+def _ranked(labels, similarities):
+    logits = similarities / config.DOMAIN_EMBEDDING_TEMPERATURE
+    probabilities = np.exp(logits - logits.max())
+    probabilities /= probabilities.sum()
+    order = np.argsort(-probabilities)
+    return [(labels[i], float(probabilities[i])) for i in order]
+
+
+def classify(text, candidate_labels, model=None):
+    """Return [(label, score)] for every label, best first.
+
+    Scores are a softmax over the cosine similarities (sharpened by
+    config.DOMAIN_EMBEDDING_TEMPERATURE), so they sum to 1 like the zero-shot
+    pipeline's scores.
+    """
+    return classify_batch([text], candidate_labels, model)[0]
+
+
+def classify_batch(texts, candidate_labels, model=None):
+    """classify() for many texts at once; returns one ranking per text, in order."""
+    model = model or model_registry.get_similarity_model()
+    if not model:
+        raise RuntimeError("SentenceTransformer model not available")
+    labels = list(candidate_labels)
+    if not texts:
+        return []
+    prototypes = label_prototypes(labels, model)
+    similarities = document_embeddings(texts, model) @ prototypes.T
+    return [_ranked(labels, row) for row in similarities]
+
+
+# Same template the zero-shot pipeline uses by default; passed explicitly so
+# the hypothesis lengths below match what the pipeline builds.
+HYPOTHESIS_TEMPLATE = "This example is {}."
+
+_hypothesis_lengths = {}
+
+
+def hypothesis_token_lengths(tokenizer, labels):
+    """Token counts of each label's hypothesis, computed once per tokenizer and label set.
+
+    The NLI model encodes premise and hypothesis together, so the hypothesis
+    encodings themselves can't be reused across CVs; their tokenized lengths
+    are what the segment budget needs.
+    """
+    key = (getattr(tokenizer, 'name_or_path', None), tuple(labels))
+    lengths = _hypothesis_lengths.get(key)
+    if lengths is None:
+        hypotheses = [HYPOTHESIS_TEMPLATE.format(label) for label in labels]
+        lengths = [len(ids) for ids in tokenizer(hypotheses, add_special_tokens=False)['input_ids']]
+        _hypothesis_lengths[key] = lengths
+    return lengths
+
+
+def segment_token_budget(tokenizer, labels):
+    """How many CV tokens fit in one premise next to the longest hypothesis."""
+    model_max = tokenizer.model_max_length
+    # Some tokenizers report a huge sentinel when the limit is unknown
+    if not model_max or model_max > 100000:
+        model_max = 512
+    if config.DOMAIN_ZERO_SHOT_CHUNK_TOKENS:
+        model_max = min(model_max, config.DOMAIN_ZERO_SHOT_CHUNK_TOKENS)
+    special = tokenizer.num_special_tokens_to_add(pair=True)
+    return max(32, model_max - max(hypothesis_token_lengths(tokenizer, labels)) - special)
+
+
+def split_token_segments(text, tokenizer, max_tokens, max_segments=None):
+    """Split text into segments of at most max_tokens tokens (at most max_segments, spread evenly)."""
+    max_segments = max_segments or config.DOMAIN_ZERO_SHOT_MAX_CHUNKS
+    try:
+        offsets = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)['offset_mapping']
+    except NotImplementedError:
+        # Slow tokenizers have no offsets; fall back to a words-per-token estimate
+        words = text.split()
+        step = max(1, int(max_tokens * 0.75))
+        segments = [" ".join(words[i:i + step]) for i in range(0, len(words), step)]
+    else:
+        if len(offsets) <= max_tokens:
+            return [text]
+        segments = []
+        for start in range(0, len(offsets), max_tokens):
+            window = offsets[start:start + max_tokens]
+            segments.append(text[window[0][0]:window[-1][1]])
+    if len(segments) > max_segments:
+        step = len(segments) / max_segments
+        segments = [segments[int(i * step)] for i in range(max_segments)]
+    return segments or [text]
+
+
+def classify_zero_shot(text, candidate_labels, classifier=None):
+    """Return [(label, score)] for every label, best first, classifying the CV in segments.
+
+    Segment scores are averaged, weighted by segment length.
+    """
+    return classify_zero_shot_batch([text], candidate_labels, classifier)[0]
+
+
+def classify_zero_shot_batch(texts, candidate_labels, classifier=None):
+    """classify_zero_shot() for many texts; returns one ranking per text, in order.
+
+    The segments of all texts go through a single pipeline call, so the
+    pipeline batches (segment, label) pairs across CVs.
+    """
+    classifier = classifier or model_registry.get_classifier()
+    if not classifier:
+        raise RuntimeError("Zero-shot classifier not available")
+    labels = list(candidate_labels)
+    if not texts:
+        return []
+    tokenizer = classifier.tokenizer
+    if config.DOMAIN_ZERO_SHOT_CHUNKING:
+        budget = segment_token_budget(tokenizer, labels)
+        segmented = [split_token_segments(text, tokenizer, budget) for text in texts]
+    else:
+        segmented = [[text] for text in texts]
+    flat = [segment for segments in segmented for segment in segments]
+    print(f"Zero-shot classification of {len(texts)} text(s), {len(flat)} segment(s) x {len(labels)} labels")
+
+    results = classifier(flat, labels, hypothesis_template=HYPOTHESIS_TEMPLATE,
+                         batch_size=config.DOMAIN_ZERO_SHOT_BATCH_SIZE)
+    if isinstance(results, dict):
+        results = [results]
+    rankings = []
+    offset = 0
+    for segments in segmented:
+        totals = dict.fromkeys(labels, 0.0)
+        total_weight = 0
+        for segment, result in zip(segments, results[offset:offset + len(segments)]):
+            weight = len(segment)
+            total_weight += weight
+            for label, score in zip(result['labels'], result['scores']):
+                totals[label] += score * weight
+        offset += len(segments)
+        scores = {label: total / max(total_weight, 1) for label, total in totals.items()}
+        rankings.append(sorted(scores.items(), key=lambda item: item[1], reverse=True))
+    return rankings
@@ -0,0 +1,88 @@
+# Persistent cache for SentenceTransformer embeddings.
+#
+# Embeddings are keyed by a SHA-256 of the model name plus the normalized text,
+# so the same CV or job description is only encoded once across searches and
+# app restarts. encode_texts() is a drop-in replacement for
+# similarity_model.encode() that only sends cache misses to the model.
+import hashlib
+import os
+import re
+
+import numpy as np
+
+import config
+import model_registry
+from disk_cache import DiskCache
+
+_cache = None
+
+
+def normalize_text(text):
+    """Collapse whitespace so trivially different copies of a text share one entry."""
+    return re.sub(r"\s+", " ", text or "").strip()
+
+
+def cache_key(text, model_name):
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_text(text).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def get_cache():
+    """Return the process-wide embedding cache (None when disabled)."""
+    global _cache
+    if not config.EMBEDDING_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = DiskCache(
+            os.path.join(config.CACHE_DIR, "embeddings.sqlite3"),
+            max_entries=config.EMBEDDING_CACHE_MAX_ENTRIES,
+            name="embedding",
+        )
+    return _cache
+
+
+def encode_texts(texts, model=None, model_name=None, batch_size=None):
+    """Encode texts into a float32 array of shape (len(texts), dim), using the cache.
+
+    Cache misses are encoded together in a single batched encode() call.
+    """
+    model = model or model_registry.get_similarity_model()
+    model_name = model_name or model_registry.SIMILARITY_MODEL_NAME
+    batch_size = batch_size or config.EMBEDDING_BATCH_SIZE
+    texts = list(texts)
+    cache = get_cache()
+
+    if cache is None:
+        return np.asarray(model.encode(texts, batch_size=batch_size, show_progress_bar=False),
+                          dtype=np.float32)
+
+    keys = [cache_key(text, model_name) for text in texts]
+    cached = cache.get_many(keys)
+
+    # Encode each distinct missing text once
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in cached and key not in missing:
+            missing[key] = text
+
+    embeddings = {key: np.frombuffer(value, dtype=np.float32) for key, value in cached.items()}
+    if missing:
+        encoded = model.encode(list(missing.values()), batch_size=batch_size, show_progress_bar=False)
+        encoded = np.asarray(encoded, dtype=np.float32)
+        new_entries = {}
+        for key, vector in zip(missing, encoded):
+            embeddings[key] = vector
+            new_entries[key] = vector.tobytes()
+        cache.set_many(new_entries)
+
+    from_cache = sum(1 for key in keys if key in cached)
+    print(f"Embedding cache: {from_cache} of {len(texts)} texts served from cache")
+    return np.vstack([embeddings[key] for key in keys]) if keys else np.zeros((0, 0), dtype=np.float32)
+
+
+def stats():
+    cache = get_cache()
+    return cache.stats() if cache else {'name': 'embedding', 'enabled': False}
@@ -0,0 +1,89 @@
+# Cache of text extracted from uploaded CVs, keyed by a hash of the file bytes, in memory and on disk.
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import config
+from disk_cache import DiskCache
+
+# Bump whenever extraction output changes (new OCR settings, page strategy,
+# ...) so stale text is not served for the new extractor.
+EXTRACTOR_VERSION = 2
+
+_cache = None
+_memory = OrderedDict()
+_memory_lock = threading.Lock()
+_memory_hits = 0
+
+
+def cache_key(file_bytes, file_name):
+    """Key for a file's extraction; file_bytes may be any bytes-like object (e.g. a memoryview)."""
+    digest = hashlib.sha256(file_bytes).hexdigest()
+    extension = os.path.splitext(file_name or "")[1].lower()
+    # The page limit changes what gets extracted from long PDFs
+    return f"v{EXTRACTOR_VERSION}:{extension}:p{config.PDF_MAX_PAGES}:{digest}"
+
+
+def get_cache():
+    """Return the process-wide on-disk extraction cache (None when disabled)."""
+    global _cache
+    if not config.EXTRACTION_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = DiskCache(
+            os.path.join(config.CACHE_DIR, "extractions.sqlite3"),
+            max_bytes=config.EXTRACTION_CACHE_MAX_BYTES,
+            name="extraction",
+        )
+    return _cache
+
+
+def _remember(key, value):
+    with _memory_lock:
+        _memory[key] = value
+        _memory.move_to_end(key)
+        while len(_memory) > config.EXTRACTION_MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def lookup(key):
+    """Return the cached (text, pages) for key, or None."""
+    global _memory_hits
+    if not config.EXTRACTION_CACHE_ENABLED:
+        return None
+    with _memory_lock:
+        if key in _memory:
+            _memory.move_to_end(key)
+            _memory_hits += 1
+            text, pages = _memory[key]
+            return text, [dict(info) for info in pages]
+
+    value = get_cache().get(key)
+    if value is None:
+        return None
+    try:
+        entry = json.loads(value.decode("utf-8"))
+    except ValueError as e:
+        print(f"Ignoring unreadable extraction cache entry: {str(e)}")
+        return None
+    _remember(key, (entry['text'], entry['pages']))
+    return entry['text'], [dict(info) for info in entry['pages']]
+
+
+def store(key, text, pages):
+    if not config.EXTRACTION_CACHE_ENABLED:
+        return
+    _remember(key, (text, [dict(info) for info in pages]))
+    get_cache().set(key, json.dumps({'text': text, 'pages': pages}).encode("utf-8"))
+
+
+def stats():
+    cache = get_cache()
+    if cache is None:
+        return {'name': 'extraction', 'enabled': False}
+    result = cache.stats()
+    result['memory_hits'] = _memory_hits
+    result['memory_entries'] = len(_memory)
+    return result
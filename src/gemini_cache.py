@@ -0,0 +1,125 @@
+# Persistent cache for Gemini responses.
+#
+# Streamlit reruns and repeat searches send the same resume and job
+# descriptions to Gemini again and again. Responses are cached on disk keyed by
+# (model name, prompt template and version, hash of the CV text, hash of the
+# job text), with a TTL and a size bound, so repeat analyses return
+# immediately and don't use quota. Only successful responses are cached.
+#
+# Looking up a response never resolves the Gemini model (that lists models
+# over the network), so cached answers are still served while the API is
+# unreachable or out of quota. The key uses the last resolved model name,
+# which is also stored in the cache so a fresh process can use it before
+# its first resolution.
+import hashlib
+import os
+import re
+
+import config
+import gemini_client
+from disk_cache import DiskCache
+
+# Bump a template's version whenever its prompt wording changes so stale
+# answers are not served for the new prompt.
+PROMPT_VERSIONS = {
+    'resume': 1,
+    'manual_text': 1,
+    'job_description': 1,
+    'job_description_cv': 1,
+    'job_match': 1,
+}
+
+# Cache entry holding the name of the last resolved model
+LAST_MODEL_KEY = "__last_model_name__"
+
+_cache = None
+_key_model_name = None
+
+
+def text_hash(text):
+    if not text:
+        return "-"
+    normalized = re.sub(r"\s+", " ", text).strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def cache_key(template, model_name, cv_text=None, job_text=None):
+    parts = [model_name, f"{template}:v{PROMPT_VERSIONS[template]}", text_hash(cv_text), text_hash(job_text)]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_cache():
+    """Return the process-wide Gemini response cache (None when disabled)."""
+    global _cache
+    if not config.GEMINI_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = DiskCache(
+            os.path.join(config.CACHE_DIR, "gemini_responses.sqlite3"),
+            max_bytes=config.GEMINI_CACHE_MAX_BYTES,
+            ttl_seconds=config.GEMINI_CACHE_TTL_SECONDS,
+            name="gemini",
+        )
+    return _cache
+
+
+def key_model_name():
+    """Model name to key responses on, without resolving the model.
+
+    That is the resolver's last resolved model; before the first resolution in
+    this process, the one recorded in the cache by an earlier process, or the
+    first preferred model.
+    """
+    global _key_model_name
+    name = gemini_client.resolver.last_model_name
+    if name:
+        return name
+    if _key_model_name is None:
+        cache = get_cache()
+        stored = cache.get(LAST_MODEL_KEY) if cache else None
+        _key_model_name = stored.decode("utf-8") if stored else gemini_client.PREFERRED_MODELS[0]
+    return _key_model_name
+
+
+def lookup(template, cv_text=None, job_text=None):
+    """Return the cached response for this template and inputs, or None."""
+    cache = get_cache()
+    if cache is None:
+        return None
+    model_name = key_model_name()
+    value = cache.get(cache_key(template, model_name, cv_text, job_text))
+    if value is None:
+        return None
+    stats = cache.stats()
+    print(f"Gemini cache hit for {template} analysis with {model_name} "
+          f"({stats['hits']} hits / {stats['misses']} misses)")
+    return value.decode("utf-8")
+
+
+def store(template, text, cv_text=None, job_text=None):
+    """Cache a response; only after a model has been resolved, so the key names the model that answered."""
+    global _key_model_name
+    cache = get_cache()
+    model_name = gemini_client.resolver.last_model_name
+    if cache is None or not text or not model_name:
+        return
+    if model_name != _key_model_name:
+        cache.set(LAST_MODEL_KEY, model_name.encode("utf-8"))
+        _key_model_name = model_name
+    cache.set(cache_key(template, model_name, cv_text, job_text), text.encode("utf-8"))
+
+
+def cached_generate(template, prompt, cv_text=None, job_text=None):
+    """Return the Gemini response text for prompt, serving repeats from the cache."""
+    cached = lookup(template, cv_text, job_text)
+    if cached is not None:
+        return cached
+    # Only a miss needs the model (and so the API)
+    text = gemini_client.generate_content(prompt).text
+    store(template, text, cv_text, job_text)
+    return text
+
+
+def stats():
+    cache = get_cache()
+    return cache.stats() if cache else {'name': 'gemini', 'enabled': False}
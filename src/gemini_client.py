@@ -0,0 +1,144 @@
+# Shared Gemini model selection.
+#
+# Picking a model means listing the available models over the network and
+# walking our preference list. That used to happen on every analysis call (and
+# once per job in match_jobs); the resolver below does it once, keeps the
+# GenerativeModel for a TTL, and only re-resolves when a call fails.
+import threading
+import time
+import traceback
+
+import config
+import model_registry
+
+PREFERRED_MODELS = [
+    'models/gemini-1.5-flash-latest',  # Prioritize Gemini 1.5 Flash Latest as requested
+    'models/gemini-1.5-flash',        # Fallback to regular Gemini 1.5 Flash
+    'models/gemini-1.5-pro',
+    'models/gemini-1.0-pro',
+    'models/gemini-1.0-pro-latest',
+    'models/gemini-2.0-flash',
+    'models/gemini-2.0-flash-001',
+    'models/gemini-2.0-flash-lite',
+    'models/gemini-2.0-flash-lite-001'
+]
+
+UNAVAILABLE_MESSAGE = "⚠️ **Gemini AI Analysis Unavailable**\n\nThe Google Gemini API service is currently unavailable. This could be due to:\n\n- API quota limits exceeded\n- Service disruption\n- API key configuration issues\n\nPlease try again later or contact support if the issue persists."
+MODELS_UNREACHABLE_MESSAGE = "⚠️ **Gemini AI Analysis Unavailable**\n\nUnable to access Gemini AI models. This could be due to API quota limits or service disruption. Please try again later."
+NO_MODEL_MESSAGE = "⚠️ **Gemini AI Analysis Unavailable**\n\nNo suitable Gemini AI models are available. This could be due to API quota limits or service disruption. Please try again later."
+
+
+class GeminiUnavailableError(Exception):
+    """Raised when no Gemini model can be used; user_message is safe to show in the UI."""
+
+    def __init__(self, message, user_message):
+        super().__init__(message)
+        self.user_message = user_message
+
+
+def is_quota_error(error):
+    error_str = str(error).lower()
+    return "quota" in error_str or "rate limit" in error_str or "429" in error_str
+
+
+def choose_model(available_models, preferred_models=PREFERRED_MODELS):
+    """Pick the best model name from available_models, or None."""
+    # First try preferred models
+    for preferred in preferred_models:
+        if preferred in available_models:
+            return preferred
+
+    # If no preferred models found, try any model with 'flash' in the name
+    for name in available_models:
+        if 'flash' in name.lower() and 'preview' not in name.lower():
+            return name
+    return None
+
+
+class GeminiModelResolver:
+    """Resolves the best available Gemini model once and caches it for ttl_seconds."""
+
+    def __init__(self, ttl_seconds=None, preferred_models=None):
+        self.ttl_seconds = config.GEMINI_MODEL_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.preferred_models = preferred_models or PREFERRED_MODELS
+        self._model = None
+        self._model_name = None
+        self._last_model_name = None
+        self._resolved_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def model_name(self):
+        return self._model_name
+
+    @property
+    def last_model_name(self):
+        """Name of the most recently resolved model; unlike model_name it survives invalidate()."""
+        return self._last_model_name
+
+    def _fresh(self):
+        return self._model is not None and time.monotonic() - self._resolved_at < self.ttl_seconds
+
+    def _resolve(self):
+        genai = model_registry.get_genai()
+        if not genai:
+            raise GeminiUnavailableError("Google Gemini API not available", UNAVAILABLE_MESSAGE)
+
+        try:
+            available_models = [model.name for model in genai.list_models()]
+        except Exception as e:
+            print(f"Error listing models: {str(e)}")
+            raise GeminiUnavailableError(f"Error listing models: {str(e)}", MODELS_UNREACHABLE_MESSAGE)
+
+        model_name = choose_model(available_models, self.preferred_models)
+        if not model_name:
+            print("No suitable Gemini model found")
+            raise GeminiUnavailableError("No suitable Gemini model found", NO_MODEL_MESSAGE)
+
+        print(f"Using Gemini model: {model_name}")
+        self._model = genai.GenerativeModel(model_name)
+        self._model_name = model_name
+        self._last_model_name = model_name
+        self._resolved_at = time.monotonic()
+        return self._model
+
+    def get_model(self):
+        """Return the cached GenerativeModel, resolving it if missing or expired."""
+        # Read once: another thread may invalidate() between the check and the return
+        model, resolved_at = self._model, self._resolved_at
+        if model is not None and time.monotonic() - resolved_at < self.ttl_seconds:
+            return model
+        with self._lock:
+            if self._fresh():
+                return self._model
+            return self._resolve()
+
+    def invalidate(self):
+        with self._lock:
+            self._model = None
+            self._model_name = None
+
+    def generate_content(self, prompt):
+        """Call generate_content on the cached model, re-resolving once if the call fails.
+
+        Quota errors are raised straight away since another model won't help.
+        """
+        model = self.get_model()
+        try:
+            return model.generate_content(prompt)
+        except Exception as e:
+            if is_quota_error(e):
+                raise
+            print(f"Gemini call failed with {getattr(model, 'model_name', 'the cached model')}, "
+                  f"re-resolving model: {str(e)}")
+            print(traceback.format_exc())
+            self.invalidate()
+            model = self.get_model()
+            return model.generate_content(prompt)
+
+
+resolver = GeminiModelResolver()
+
+
+def generate_content(prompt):
+    return resolver.generate_content(prompt)
@@ -0,0 +1,198 @@
+# Runs Gemini requests on a small worker pool, best-ranked first, within requests- and
+# tokens-per-minute budgets, retrying quota errors with backoff.
+import heapq
+import random
+import threading
+import time
+import traceback
+from collections import deque
+
+import config
+import gemini_client
+
+# Rough allowance for the response when budgeting tokens per request
+EXPECTED_OUTPUT_TOKENS = 1024
+
+
+def estimate_tokens(prompt):
+    """Cheap token estimate (about 4 characters per token) plus the response allowance."""
+    return len(prompt) // 4 + EXPECTED_OUTPUT_TOKENS
+
+
+class GeminiBackend:
+    """Sends prompts to Gemini through the shared model resolver."""
+
+    def generate(self, prompt):
+        return gemini_client.generate_content(prompt).text
+
+
+class StubQuotaError(Exception):
+    pass
+
+
+class StubBackend:
+    """Local stand-in for Gemini: returns canned text, optionally slow or rate limited.
+
+    fail_first makes the first N calls raise a 429-style error so retry and
+    backoff behaviour can be exercised without a real quota.
+    """
+
+    def __init__(self, latency=0.0, fail_first=0, response=None):
+        self.latency = latency
+        self.fail_first = fail_first
+        self.response = response
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def generate(self, prompt):
+        with self._lock:
+            self.calls.append(prompt)
+            call_number = len(self.calls)
+        if self.latency:
+            time.sleep(self.latency)
+        if call_number <= self.fail_first:
+            raise StubQuotaError("429 Resource has been exhausted (e.g. check quota).")
+        if self.response is not None:
+            return self.response(prompt) if callable(self.response) else self.response
+        return f"Stub analysis of {len(prompt)} characters"
+
+
+class RateLimiter:
+    """Sliding one-minute window over request count and estimated tokens."""
+
+    def __init__(self, requests_per_minute, tokens_per_minute, window_seconds=60.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self._events = deque()
+        self._tokens_in_window = 0
+        self._condition = threading.Condition()
+
+    def _expire(self, now):
+        while self._events and now - self._events[0][0] >= self.window_seconds:
+            _, tokens = self._events.popleft()
+            self._tokens_in_window -= tokens
+
+    def _wait_time(self, tokens, now):
+        if not self._events:
+            return 0.0
+        if self.requests_per_minute and len(self._events) >= self.requests_per_minute:
+            return self._events[0][0] + self.window_seconds - now
+        if self.tokens_per_minute and self._tokens_in_window + tokens > self.tokens_per_minute:
+            # Wait until enough old requests leave the window
+            needed = self._tokens_in_window + tokens - self.tokens_per_minute
+            for timestamp, event_tokens in self._events:
+                needed -= event_tokens
+                if needed <= 0:
+                    return timestamp + self.window_seconds - now
+            # Larger than the whole budget: run it once the window is empty
+            return self._events[-1][0] + self.window_seconds - now
+        return 0.0
+
+    def acquire(self, tokens):
+        """Block until a request of the given size fits in the budget, then record it."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                wait = self._wait_time(tokens, now)
+                if wait <= 0:
+                    self._events.append((now, tokens))
+                    self._tokens_in_window += tokens
+                    return
+                self._condition.wait(wait)
+
+
+class GeminiScheduler:
+    """Runs prompts concurrently within a rate budget, best priority first."""
+
+    def __init__(self, backend=None, requests_per_minute=None, tokens_per_minute=None,
+                 max_concurrency=None, max_retries=None, backoff_seconds=None, max_backoff_seconds=60.0):
+        self.backend = backend or GeminiBackend()
+        self.limiter = RateLimiter(
+            config.GEMINI_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute,
+            config.GEMINI_TOKENS_PER_MINUTE if tokens_per_minute is None else tokens_per_minute,
+        )
+        self.max_concurrency = max_concurrency or config.GEMINI_MAX_CONCURRENCY
+        self.max_retries = config.GEMINI_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_seconds = config.GEMINI_BACKOFF_SECONDS if backoff_seconds is None else backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+    def _backoff(self, attempt):
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    def _run_one(self, key, prompt):
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            self.limiter.acquire(estimate_tokens(prompt))
+            try:
+                text = self.backend.generate(prompt)
+                return {'key': key, 'status': 'ok', 'text': text, 'error': None,
+                        'exception': None, 'attempts': attempt + 1,
+                        'seconds': time.perf_counter() - start}
+            except Exception as e:
+                if gemini_client.is_quota_error(e) and attempt < self.max_retries:
+                    delay = self._backoff(attempt)
+                    print(f"Gemini quota hit for {key}, retrying in {delay:.1f}s (attempt {attempt + 1})")
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                if not gemini_client.is_quota_error(e):
+                    print(f"Error in Gemini request {key}: {str(e)}")
+                    print(traceback.format_exc())
+                return {'key': key, 'status': 'quota' if gemini_client.is_quota_error(e) else 'error',
+                        'text': None, 'error': str(e), 'exception': e, 'attempts': attempt + 1,
+                        'seconds': time.perf_counter() - start}
+
+    def run(self, requests, on_result=None):
+        """Run (priority, key, prompt) requests and return {key: result}.
+
+        Lower priority values run first. Each result has 'status' ('ok',
+        'quota' or 'error'), 'text', 'error', 'exception', 'attempts' and
+        'seconds'. on_result is called from worker threads as results arrive.
+        """
+        queue = [(priority, seq, key, prompt) for seq, (priority, key, prompt) in enumerate(requests)]
+        heapq.heapify(queue)
+        results = {}
+        lock = threading.Lock()
+
+        def worker():
+            while True:
+                with lock:
+                    if not queue:
+                        return
+                    _, _, key, prompt = heapq.heappop(queue)
+                result = self._run_one(key, prompt)
+                with lock:
+                    results[key] = result
+                if on_result:
+                    on_result(result)
+
+        if not queue:
+            return results
+        start = time.perf_counter()
+        threads = [threading.Thread(target=worker, name=f"gemini-{i}", daemon=True)
+                   for i in range(min(self.max_concurrency, len(queue)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        ok = sum(1 for result in results.values() if result['status'] == 'ok')
+        print(f"Gemini scheduler finished {ok}/{len(results)} requests in {time.perf_counter() - start:.1f}s")
+        return results
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """Return the process-wide scheduler so every session shares one rate budget."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = GeminiScheduler()
+        return _scheduler
@@ -0,0 +1,127 @@
+# Shared requests.Session for all scraper HTTP traffic: pooled keep-alive connections per host,
+# retries with backoff on connection errors and 429/5xx, and compressed responses.
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import config
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+              'Chrome/58.0.3029.110 Safari/537.36')
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def accept_encoding():
+    # urllib3 only decodes br when a brotli implementation is importable
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+            return "gzip, deflate, br"
+        except ImportError:
+            continue
+    return "gzip, deflate"
+
+
+class HttpClient:
+    """A requests.Session with per-host connection pools, retries and request metrics."""
+
+    def __init__(self, pool_hosts=None, pool_size=None, retries=None, backoff=None, timeout=None):
+        self.timeout = config.HTTP_TIMEOUT_SECONDS if timeout is None else timeout
+        retry = Retry(
+            total=config.HTTP_RETRIES if retries is None else retries,
+            backoff_factor=config.HTTP_RETRY_BACKOFF if backoff is None else backoff,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            # Hand the last response back instead of raising; callers use raise_for_status()
+            raise_on_status=False,
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_hosts or config.HTTP_POOL_HOSTS,
+            pool_maxsize=pool_size or config.HTTP_POOL_SIZE,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': accept_encoding()})
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._retries = 0
+        self._seconds = 0.0
+        self._hosts = {}
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        start = time.perf_counter()
+        response = None
+        try:
+            response = self.session.get(url, **kwargs)
+            return response
+        finally:
+            self._record(url, response, time.perf_counter() - start)
+
+    def _record(self, url, response, seconds):
+        host = requests.utils.urlparse(url).netloc
+        retries = 0
+        if response is not None:
+            history = getattr(getattr(response.raw, 'retries', None), 'history', None)
+            retries = len(history or ())
+        with self._lock:
+            self._requests += 1
+            self._retries += retries
+            self._seconds += seconds
+            self._hosts[host] = self._hosts.get(host, 0) + 1
+            if response is None or response.status_code >= 400:
+                self._errors += 1
+
+    def stats(self):
+        """Request counts plus, per pooled host, connections opened vs requests sent."""
+        pools = {}
+        poolmanager = self.adapter.poolmanager
+        for key in list(poolmanager.pools.keys()):
+            pool = poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            pools[pool.host] = {'connections_opened': pool.num_connections, 'requests': pool.num_requests}
+        with self._lock:
+            return {
+                'requests': self._requests,
+                'errors': self._errors,
+                'retries': self._retries,
+                'mean_ms': round(self._seconds / self._requests * 1000, 1) if self._requests else 0.0,
+                'requests_by_host': dict(self._hosts),
+                'pools': pools,
+            }
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide HttpClient, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def get(url, **kwargs):
+    """GET url through the shared session (default timeout config.HTTP_TIMEOUT_SECONDS)."""
+    return get_client().get(url, **kwargs)
+
+
+def stats():
+    return get_client().stats() if _client is not None else {'requests': 0}
@@ -0,0 +1,22 @@
+# Paging of the ranked job list, and which jobs on a page still need a Gemini analysis.
+import math
+
+import config
+
+
+def page_count(jobs, per_page=None):
+    per_page = per_page or config.JOBS_PER_PAGE
+    return max(1, math.ceil(len(jobs) / per_page))
+
+
+def page_jobs(jobs, page, per_page=None):
+    """Return [(rank, job)] for a 1-based page (clamped to the valid range); rank indexes jobs."""
+    per_page = per_page or config.JOBS_PER_PAGE
+    page = min(max(1, page), page_count(jobs, per_page))
+    start = (page - 1) * per_page
+    return [(start + i, job) for i, job in enumerate(jobs[start:start + per_page])]
+
+
+def needs_analysis(job):
+    """True for a job without a Gemini analysis (ranked below the up-front top-K)."""
+    return not job.get('gemini_analysis')
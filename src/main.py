@@ -1,6 +1,18 @@
 import streamlit as st
 import pandas as pd
 import utils
+import browser_pool
+import config
+import chromedriver
+import cv_labels
+import model_registry
+import embedding_cache
+import extraction_cache
+import gemini_cache
+import http_client
+import job_view
+import scraping_engine
+import skill_taxonomy
 import traceback
 import os
 import sys
@@ -10,6 +22,9 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Resolve chromedriver now rather than on the first Naukri search (no-op on reruns)
+chromedriver.warm_in_background()
+
 # Set page config
 st.set_page_config(page_title="CVision: Smart Job Finder", layout="wide")
 # Add this CSS right after your st.set_page_config() call
@@ -179,6 +194,21 @@ if 'gemini_api_key' not in st.session_state:
 # Set the API key in session state
 st.session_state.gemini_api_key = os.environ.get("GEMINI_API_KEY", "")
 
+def search_jobs(domain, platforms):
+    """Scrape the selected platforms concurrently, reporting each one as it finishes."""
+    with st.status("Searching for jobs...") as status:
+        def report(result):
+            if result['status'] == 'ok':
+                status.write(f"{result['platform']}: {len(result['jobs'])} jobs ({result['seconds']:.1f}s)")
+            elif result['status'] == 'timeout':
+                status.write(f"{result['platform']}: timed out, skipped")
+            else:
+                status.write(f"{result['platform']}: error ({result['error']})")
+
+        all_jobs, results = scraping_engine.scrape_platforms(domain, platforms, on_result=report)
+        status.update(label=f"Found {len(all_jobs)} jobs on {len(results)} platforms", state="complete")
+    return all_jobs
+
 # Sidebar for CV upload and manual search
 with st.sidebar:
     st.header("Upload Your CV")
@@ -219,14 +249,30 @@ with st.sidebar:
     st.header("AI Analysis Settings")
     st.info("Google Gemini provides advanced resume and job analysis")
     
-    # Check if Gemini API is available
-    if utils.GEMINI_AVAILABLE:
+    # Gemini is checked on the first analysis, not on every page load
+    gemini_state = model_registry.gemini_state()
+    if gemini_state == 'loaded':
         st.success("Gemini API is configured and ready to use")
-    else:
+    elif gemini_state == 'failed':
         st.warning("⚠️ Gemini API is currently unavailable. This may be due to quota limits or service disruption.")
+    elif not config.GEMINI_API_KEY:
+        st.warning("⚠️ GEMINI_API_KEY is not set, so Gemini analysis is unavailable.")
+    else:
+        st.info("Gemini API not checked yet; it is connected on the first AI analysis.")
     
     use_gemini = st.checkbox("Enable Gemini AI Analysis", value=True)
 
+    # Models are loaded lazily on first use; show what this worker has loaded so far
+    with st.expander("Model Load Status"):
+        st.json(model_registry.registry.status())
+        st.caption("Cache hits and misses since this worker started")
+        st.json({'embeddings': embedding_cache.stats(), 'gemini': gemini_cache.stats(),
+                 'extraction': extraction_cache.stats()})
+        st.caption("HTTP requests and connection reuse")
+        st.json(http_client.stats())
+        st.caption("Headless browser pool")
+        st.json(browser_pool.stats())
+
     if st.button("Search Jobs by Domain"):
         if manual_domain:
             st.session_state.domain = manual_domain
@@ -236,45 +282,7 @@ with st.sidebar:
             st.session_state.error_message = None
             print(f"\n===== MANUAL SEARCH FOR: {manual_domain} =====\n")
             try:
-                all_jobs = []
-                with st.spinner("Searching for jobs..."):
-                    for platform in selected_platforms:
-                        if platform == "LinkedIn":
-                            linkedin_jobs = utils.scrape_linkedin(st.session_state.domain)
-                            for job in linkedin_jobs:
-                                job['platform'] = 'LinkedIn'
-                            all_jobs.extend(linkedin_jobs)
-                            print(f"Found {len(linkedin_jobs)} jobs on LinkedIn")
-                        elif platform == "Upwork":
-                            upwork_jobs = utils.scrape_upwork(st.session_state.domain)
-                            for job in upwork_jobs:
-                                job['platform'] = 'Upwork'
-                            all_jobs.extend(upwork_jobs)
-                            print(f"Found {len(upwork_jobs)} jobs on Upwork")
-                        elif platform == "Fiverr":
-                            fiverr_jobs = utils.scrape_fiverr(st.session_state.domain)
-                            for job in fiverr_jobs:
-                                job['platform'] = 'Fiverr'
-                            all_jobs.extend(fiverr_jobs)
-                            print(f"Found {len(fiverr_jobs)} jobs on Fiverr")
-                        elif platform == "Indeed":
-                            indeed_jobs = utils.scrape_indeed(st.session_state.domain)
-                            for job in indeed_jobs:
-                                job['platform'] = 'Indeed'
-                            all_jobs.extend(indeed_jobs)
-                            print(f"Found {len(indeed_jobs)} jobs on Indeed")
-                        elif platform == "Naukri.com":
-                            naukri_jobs = utils.scrape_naukri(st.session_state.domain)
-                            for job in naukri_jobs:
-                                job['platform'] = 'Naukri.com'
-                            all_jobs.extend(naukri_jobs)
-                            print(f"Found {len(naukri_jobs)} jobs on Naukri.com")
-                        elif platform == "Internshala":
-                            internshala_jobs = utils.scrape_internshala(st.session_state.domain)
-                            for job in internshala_jobs:
-                                job['platform'] = 'Internshala'
-                            all_jobs.extend(internshala_jobs)
-                            print(f"Found {len(internshala_jobs)} jobs on Internshala")
+                all_jobs = search_jobs(st.session_state.domain, selected_platforms)
                 st.session_state.jobs = all_jobs
             except Exception as e:
                 print(f"Error finding jobs: {str(e)}")
@@ -289,15 +297,11 @@ with st.sidebar:
         # Extract text from CV
         try:
             print(f"\n\n===== PROCESSING NEW CV UPLOAD: {uploaded_file.name} =====\n")
-            st.session_state.cv_text = utils.extract_text(uploaded_file)
+            st.session_state.cv_text, cv_pages = utils.extract_text_with_metadata(uploaded_file)
             st.session_state.error_message = None
             
             # Check if the returned text is an error message
-            if st.session_state.cv_text and isinstance(st.session_state.cv_text, str) and \
-               (st.session_state.cv_text.startswith("Error") or \
-                st.session_state.cv_text.startswith("This appears") or \
-                st.session_state.cv_text.startswith("No text") or \
-                st.session_state.cv_text.startswith("Unsupported")):
+            if utils.is_extraction_error(st.session_state.cv_text):
                 
                 st.session_state.error_message = st.session_state.cv_text
                 st.session_state.cv_text = None
@@ -307,23 +311,16 @@ with st.sidebar:
             elif st.session_state.cv_text:
                 print(f"Successfully extracted CV text: {len(st.session_state.cv_text)} characters")
                 st.write(f"CV text extracted ({len(st.session_state.cv_text)} characters)")
+                ocr_pages = [info['page'] for info in cv_pages if info['strategy'] == 'ocr']
+                if ocr_pages:
+                    st.caption(f"OCR used for page(s) {', '.join(map(str, ocr_pages))} of {len(cv_pages)}")
+                skipped_pages = sum(1 for info in cv_pages if info['strategy'] == 'skipped')
+                if skipped_pages:
+                    st.caption(f"Only the first {len(cv_pages) - skipped_pages} of {len(cv_pages)} pages were read")
                 
                 # Determine job domain
                 try:
-                    candidate_labels = [
-                        # Technical Domains
-                        "Software Engineering", "Data Science", "Machine Learning", "Artificial Intelligence", 
-                        "Backend Development", "Frontend Development", "Full Stack Development", 
-                        "DevOps Engineering", "Cloud Computing", "Mobile App Development",
-                        "Game Development", "Cybersecurity", "Database Administration", "UI/UX Design",
-                        "Blockchain Development", "IoT Development", "Embedded Systems", "QA Engineering",
-                        
-                        # Business Domains
-                        "Marketing", "Digital Marketing", "Content Creation", "Sales", "Finance", 
-                        "Accounting", "Human Resources", "Operations", "Project Management", 
-                        "Product Management", "Business Analysis", "Customer Support",
-                        "Supply Chain Management", "E-commerce", "Healthcare", "Education"
-                    ]
+                    candidate_labels = cv_labels.DOMAIN_LABELS
                     
                     domain, confidence = utils.get_domain(st.session_state.cv_text, candidate_labels)
                     st.session_state.domain = domain
@@ -336,89 +333,8 @@ with st.sidebar:
                 
                 # Extract skills
                 try:
-                    # Common skills across domains
-                    skills_list = [
-                        # Programming Languages
-                        "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Ruby", "Go", "Rust", 
-                        "PHP", "Swift", "Kotlin", "Scala", "R", "MATLAB", "Perl", "Shell Scripting", "Bash",
-                        "Assembly", "Objective-C", "Dart", "Groovy", "Lua", "Haskell", "Clojure",
-                        
-                        # Frontend Development
-                        "HTML", "CSS", "React", "Angular", "Vue.js", "jQuery", "Bootstrap", "Tailwind CSS",
-                        "Material UI", "Redux", "Next.js", "Gatsby", "Svelte", "Webpack", "Babel", "SASS",
-                        "LESS", "Responsive Design", "Progressive Web Apps", "Web Components", "WebSockets",
-                        
-                        # Backend Development
-                        "Node.js", "Express.js", "Django", "Flask", "Spring Boot", "Laravel", "Ruby on Rails",
-                        "ASP.NET", "FastAPI", "GraphQL", "REST API", "Microservices", "Serverless",
-                        "gRPC", "WebSockets", "Socket.io", "Nginx", "Apache", "OAuth", "JWT", "SOAP",
-                        
-                        # Database & Data Storage
-                        "SQL", "MySQL", "PostgreSQL", "MongoDB", "SQLite", "Oracle", "SQL Server",
-                        "Redis", "Elasticsearch", "Cassandra", "DynamoDB", "Firebase", "Neo4j", "Couchbase",
-                        "MariaDB", "InfluxDB", "Supabase", "Fauna", "ORM", "Mongoose", "Sequelize", "Prisma",
-                        
-                        # DevOps & Cloud
-                        "Docker", "Kubernetes", "Jenkins", "Git", "GitHub", "GitLab", "Bitbucket", "CI/CD",
-                        "AWS", "Azure", "GCP", "Terraform", "Ansible", "Puppet", "Chef", "Prometheus",
-                        "Grafana", "ELK Stack", "Heroku", "DigitalOcean", "Vercel", "Netlify", "CircleCI",
-                        "Travis CI", "GitHub Actions", "Vagrant", "Helm", "Istio", "Service Mesh",
-                        
-                        # AI & Machine Learning
-                        "Machine Learning", "Deep Learning", "NLP", "Computer Vision", "TensorFlow",
-                        "PyTorch", "Keras", "Scikit-learn", "OpenCV", "NLTK", "spaCy", "Hugging Face",
-                        "Transformers", "GPT", "BERT", "Neural Networks", "Reinforcement Learning",
-                        "Supervised Learning", "Unsupervised Learning", "Transfer Learning", "LLMs",
-                        "Generative AI", "MLOps", "Feature Engineering", "Model Deployment",
-                        
-                        # Data Science & Analytics
-                        "Data Analysis", "Data Visualization", "Data Mining", "Big Data", "Hadoop",
-                        "Spark", "Pandas", "NumPy", "SciPy", "Matplotlib", "Seaborn", "Tableau",
-                        "Power BI", "Looker", "Databricks", "ETL", "Data Warehousing", "Data Modeling",
-                        "Statistical Analysis", "A/B Testing", "Regression Analysis", "Time Series Analysis",
-                        
-                        # Mobile Development
-                        "Android", "iOS", "React Native", "Flutter", "Xamarin", "Ionic", "Swift UI",
-                        "Jetpack Compose", "Mobile UI Design", "App Store Optimization", "Push Notifications",
-                        "Mobile Analytics", "Responsive Design", "Cross-platform Development",
-                        
-                        # Game Development
-                        "Unity", "Unreal Engine", "Godot", "Game Design", "3D Modeling", "Animation",
-                        "Physics Engines", "Shader Programming", "Level Design", "Game AI", "Multiplayer",
-                        
-                        # Cybersecurity
-                        "Network Security", "Penetration Testing", "Ethical Hacking", "Cryptography",
-                        "Security Auditing", "Vulnerability Assessment", "OWASP", "Firewall Configuration",
-                        "Intrusion Detection", "Security Compliance", "Identity Management", "Zero Trust",
-                        
-                        # Blockchain & Web3
-                        "Blockchain", "Smart Contracts", "Solidity", "Ethereum", "Web3.js", "NFTs",
-                        "DeFi", "Cryptocurrency", "Consensus Algorithms", "Distributed Ledger",
-                        
-                        # Project Management & Methodologies
-                        "Agile", "Scrum", "Kanban", "Waterfall", "Lean", "Six Sigma", "JIRA",
-                        "Confluence", "Trello", "Asana", "Monday.com", "MS Project", "Product Management",
-                        "Sprint Planning", "Backlog Grooming", "User Stories", "Acceptance Criteria",
-                        
-                        # Design & Creative
-                        "UI Design", "UX Design", "Figma", "Adobe XD", "Sketch", "Photoshop",
-                        "Illustrator", "InDesign", "After Effects", "Premiere Pro", "Wireframing",
-                        "Prototyping", "User Research", "Usability Testing", "Design Thinking",
-                        
-                        # Business & Marketing
-                        "SEO", "SEM", "Content Marketing", "Social Media Marketing", "Email Marketing",
-                        "Google Analytics", "CRM", "Salesforce", "HubSpot", "Market Research",
-                        "Competitive Analysis", "Business Strategy", "Financial Analysis", "Budgeting",
-                        
-                        # Soft skills
-                        "Communication", "Leadership", "Teamwork", "Problem Solving", "Critical Thinking",
-                        "Time Management", "Project Management", "Creativity", "Adaptability",
-                        "Attention to Detail", "Emotional Intelligence", "Conflict Resolution",
-                        "Negotiation", "Public Speaking", "Customer Service", "Mentoring", "Coaching",
-                        "Decision Making", "Strategic Thinking", "Analytical Skills", "Interpersonal Skills"
-                    ]
-                    
-                    st.session_state.skills = utils.extract_skills(st.session_state.cv_text, skills_list)
+                    # Skills, aliases and the compiled matcher come from the skill taxonomy
+                    st.session_state.skills = utils.extract_skills(st.session_state.cv_text)
                     print(f"Extracted skills: {st.session_state.skills}")
                 except Exception as e:
                     print(f"Error extracting skills: {str(e)}")
@@ -466,61 +382,8 @@ if st.session_state.cv_text:
     with col2:
         st.subheader("Extracted Skills")
         if st.session_state.skills and len(st.session_state.skills) > 0:
-            # Define skill categories for grouping
-            skill_categories = {
-                "Programming Languages": ["Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "Ruby", "Go", "Rust", 
-                                      "PHP", "Swift", "Kotlin", "Scala", "R", "MATLAB", "Perl", "Shell Scripting", "Bash",
-                                      "Assembly", "Objective-C", "Dart", "Groovy", "Lua", "Haskell", "Clojure"],
-                
-                "Frontend": ["HTML", "CSS", "React", "Angular", "Vue.js", "jQuery", "Bootstrap", "Tailwind CSS",
-                           "Material UI", "Redux", "Next.js", "Gatsby", "Svelte", "Webpack", "Babel", "SASS",
-                           "LESS", "Responsive Design", "Progressive Web Apps", "Web Components", "WebSockets"],
-                
-                "Backend": ["Node.js", "Express.js", "Django", "Flask", "Spring Boot", "Laravel", "Ruby on Rails",
-                          "ASP.NET", "FastAPI", "GraphQL", "REST API", "Microservices", "Serverless",
-                          "gRPC", "WebSockets", "Socket.io", "Nginx", "Apache", "OAuth", "JWT", "SOAP"],
-                
-                "Database": ["SQL", "MySQL", "PostgreSQL", "MongoDB", "SQLite", "Oracle", "SQL Server",
-                           "Redis", "Elasticsearch", "Cassandra", "DynamoDB", "Firebase", "Neo4j", "Couchbase",
-                           "MariaDB", "InfluxDB", "Supabase", "Fauna", "ORM", "Mongoose", "Sequelize", "Prisma"],
-                
-                "DevOps & Cloud": ["Docker", "Kubernetes", "Jenkins", "Git", "GitHub", "GitLab", "Bitbucket", "CI/CD",
-                                 "AWS", "Azure", "GCP", "Terraform", "Ansible", "Puppet", "Chef", "Prometheus",
-                                 "Grafana", "ELK Stack", "Heroku", "DigitalOcean", "Vercel", "Netlify", "CircleCI",
-                                 "Travis CI", "GitHub Actions", "Vagrant", "Helm", "Istio", "Service Mesh"],
-                
-                "AI & ML": ["Machine Learning", "Deep Learning", "NLP", "Computer Vision", "TensorFlow",
-                          "PyTorch", "Keras", "Scikit-learn", "OpenCV", "NLTK", "spaCy", "Hugging Face",
-                          "Transformers", "GPT", "BERT", "Neural Networks", "Reinforcement Learning",
-                          "Supervised Learning", "Unsupervised Learning", "Transfer Learning", "LLMs",
-                          "Generative AI", "MLOps", "Feature Engineering", "Model Deployment"],
-                
-                "Data Science": ["Data Analysis", "Data Visualization", "Data Mining", "Big Data", "Hadoop",
-                               "Spark", "Pandas", "NumPy", "SciPy", "Matplotlib", "Seaborn", "Tableau",
-                               "Power BI", "Looker", "Databricks", "ETL", "Data Warehousing", "Data Modeling",
-                               "Statistical Analysis", "A/B Testing", "Regression Analysis", "Time Series Analysis"],
-                
-                "Mobile": ["Android", "iOS", "React Native", "Flutter", "Xamarin", "Ionic", "Swift UI",
-                         "Jetpack Compose", "Mobile UI Design", "App Store Optimization", "Push Notifications",
-                         "Mobile Analytics", "Responsive Design", "Cross-platform Development"],
-                
-                "Other Technical": ["Game Development", "Unity", "Unreal Engine", "Godot", "3D Modeling", "Animation",
-                                  "Cybersecurity", "Network Security", "Penetration Testing", "Ethical Hacking", "Cryptography",
-                                  "Blockchain", "Smart Contracts", "Solidity", "Ethereum", "Web3.js", "NFTs"],
-                
-                "Soft Skills": ["Communication", "Leadership", "Teamwork", "Problem Solving", "Critical Thinking",
-                              "Time Management", "Project Management", "Creativity", "Adaptability",
-                              "Attention to Detail", "Emotional Intelligence", "Conflict Resolution",
-                              "Negotiation", "Public Speaking", "Customer Service", "Mentoring", "Coaching",
-                              "Decision Making", "Strategic Thinking", "Analytical Skills", "Interpersonal Skills"]
-            }
-            
-            # Group extracted skills by category
-            categorized_skills = {}
-            for category, skills in skill_categories.items():
-                matched_skills = [skill for skill in st.session_state.skills if skill in skills]
-                if matched_skills:
-                    categorized_skills[category] = matched_skills
+            # Group extracted skills by category (one lookup per found skill)
+            categorized_skills, uncategorized = skill_taxonomy.get_taxonomy().categorize(st.session_state.skills)
             
             # Display skills by category
             if categorized_skills:
@@ -529,8 +392,6 @@ if st.session_state.cv_text:
                         st.write(", ".join(skills))
             
             # Display uncategorized skills
-            all_categorized = [skill for category_skills in categorized_skills.values() for skill in category_skills]
-            uncategorized = [skill for skill in st.session_state.skills if skill not in all_categorized]
             if uncategorized:
                 with st.expander(f"Other Skills ({len(uncategorized)})"):
                     st.write(", ".join(uncategorized))
@@ -563,50 +424,13 @@ if st.session_state.cv_text:
     st.header("Find Matching Jobs")
     if st.button("Find Matching Jobs"):
         try:
-            all_jobs = []
             print(f"\n===== SEARCHING JOBS FOR: {st.session_state.domain} =====\n")
-            with st.spinner("Searching for jobs..."):
-                for platform in selected_platforms:
-                    if platform == "LinkedIn":
-                        linkedin_jobs = utils.scrape_linkedin(st.session_state.domain)
-                        for job in linkedin_jobs:
-                            job['platform'] = 'LinkedIn'
-                        all_jobs.extend(linkedin_jobs)
-                        print(f"Found {len(linkedin_jobs)} jobs on LinkedIn")
-                    elif platform == "Upwork":
-                        upwork_jobs = utils.scrape_upwork(st.session_state.domain)
-                        for job in upwork_jobs:
-                            job['platform'] = 'Upwork'
-                        all_jobs.extend(upwork_jobs)
-                        print(f"Found {len(upwork_jobs)} jobs on Upwork")
-                    elif platform == "Fiverr":
-                        fiverr_jobs = utils.scrape_fiverr(st.session_state.domain)
-                        for job in fiverr_jobs:
-                            job['platform'] = 'Fiverr'
-                        all_jobs.extend(fiverr_jobs)
-                        print(f"Found {len(fiverr_jobs)} jobs on Fiverr")
-                    elif platform == "Indeed":
-                        indeed_jobs = utils.scrape_indeed(st.session_state.domain)
-                        for job in indeed_jobs:
-                            job['platform'] = 'Indeed'
-                        all_jobs.extend(indeed_jobs)
-                        print(f"Found {len(indeed_jobs)} jobs on Indeed")
-                    elif platform == "Naukri.com":
-                        naukri_jobs = utils.scrape_naukri(st.session_state.domain)
-                        for job in naukri_jobs:
-                            job['platform'] = 'Naukri.com'
-                        all_jobs.extend(naukri_jobs)
-                        print(f"Found {len(naukri_jobs)} jobs on Naukri.com")
-                    elif platform == "Internshala":
-                        internshala_jobs = utils.scrape_internshala(st.session_state.domain)
-                        for job in internshala_jobs:
-                            job['platform'] = 'Internshala'
-                        all_jobs.extend(internshala_jobs)
-                        print(f"Found {len(internshala_jobs)} jobs on Internshala")
+            all_jobs = search_jobs(st.session_state.domain, selected_platforms)
 
             if all_jobs:
                 print("Matching jobs to CV...")
-                st.session_state.jobs = utils.match_jobs(st.session_state.cv_text, all_jobs)
+                st.session_state.jobs = utils.match_jobs(st.session_state.cv_text, all_jobs,
+                                                         analyze_top_k=None if use_gemini else 0)
                 print(f"Matched {len(st.session_state.jobs)} jobs")
             else:
                 print("No jobs found on selected platforms")
@@ -624,8 +448,13 @@ if st.session_state.jobs and len(st.session_state.jobs) > 0:
     st.header("Matching Jobs")
     st.write(f"Found {len(st.session_state.jobs)} matching jobs")
     
-    # Limit to 10 jobs
-    jobs_to_display = st.session_state.jobs[:10]
+    # Page through every ranked job; only the top-K were analyzed up front
+    pages = job_view.page_count(st.session_state.jobs)
+    if st.session_state.get('jobs_page', 1) > pages:
+        st.session_state.jobs_page = 1
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1,
+                           key="jobs_page") if pages > 1 else 1
+    jobs_to_display = job_view.page_jobs(st.session_state.jobs, page)
     
     # Create a DataFrame for better display
     jobs_df = pd.DataFrame([
@@ -634,7 +463,7 @@ if st.session_state.jobs and len(st.session_state.jobs) > 0:
             "Title": job["title"],
             "Match Score": f"{job.get('match_score', 'N/A'):.2f}" if isinstance(job.get('match_score'), float) else 'N/A',
             "Link": job["link"]
-        } for job in jobs_to_display
+        } for _, job in jobs_to_display
     ])
     
     # Display as a table with clickable links
@@ -648,13 +477,13 @@ if st.session_state.jobs and len(st.session_state.jobs) > 0:
     
     # Display detailed job information with Gemini analysis
     st.header("Job Details and Analysis")
-    for i, job in enumerate(jobs_to_display):
-        with st.expander(f"{i+1}. {job['title']} ({job.get('platform', 'N/A')})"): 
+    for rank, job in jobs_to_display:
+        with st.expander(f"{rank+1}. {job['title']} ({job.get('platform', 'N/A')})"): 
             st.markdown(f"**Match Score:** {job.get('match_score', 'N/A'):.2f}" if isinstance(job.get('match_score'), float) else "**Match Score:** N/A")
             st.markdown(f"**Job Link:** [{job['link']}]({job['link']})")
             
             # Display Gemini analysis if available
-            if 'gemini_analysis' in job and job['gemini_analysis']:
+            if not job_view.needs_analysis(job):
                 st.subheader("Gemini AI Job Analysis")
                 # Check if the analysis is an error message
                 if isinstance(job['gemini_analysis'], str) and (job['gemini_analysis'].startswith("Error") or job['gemini_analysis'].startswith("⚠️")):
@@ -662,24 +491,21 @@ if st.session_state.jobs and len(st.session_state.jobs) > 0:
                 else:
                     st.markdown(job['gemini_analysis'])
             elif st.session_state.gemini_api_key and 'use_gemini' in locals() and use_gemini and st.session_state.cv_text:
-                try:
-                    with st.spinner("Analyzing job description with Google Gemini AI..."):
-                        job_desc = utils.get_job_description(job['link'])
-                        if job_desc:
-                            analysis = utils.analyze_job_description_with_gemini(job_desc, st.session_state.cv_text)
+                # Only the top matches are analyzed up front; the rest on request
+                if st.button("Analyze with Gemini AI", key=f"analyze_job_{rank}"):
+                    try:
+                        with st.spinner("Analyzing job description with Google Gemini AI..."):
+                            analysis = utils.analyze_job_on_demand(job, st.session_state.cv_text)
                             if analysis:
-                                job['gemini_analysis'] = analysis
                                 # Check if the analysis is an error message
                                 if isinstance(analysis, str) and (analysis.startswith("Error") or analysis.startswith("⚠️")):
                                     st.warning(analysis)
                                 else:
                                     st.markdown(analysis)
                             else:
-                                st.warning("Gemini analysis could not be generated")
-                        else:
-                            st.warning("Could not fetch job description")
-                except Exception as e:
-                    st.error(f"Error analyzing job with Gemini AI: {str(e)}")
+                                st.warning("Could not fetch job description")
+                    except Exception as e:
+                        st.error(f"Error analyzing job with Gemini AI: {str(e)}")
             elif not ('use_gemini' in locals() and use_gemini):
                 st.info("Enable Gemini AI Analysis in the sidebar for advanced job insights")
 
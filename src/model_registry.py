@@ -0,0 +1,183 @@
+# Lazy, per-process registry for the heavy models used by CVision.
+#
+# Nothing in this module imports spaCy, transformers, sentence-transformers or
+# calls the Gemini API at import time. Each model is loaded on first use, kept
+# as a single shared instance for the lifetime of the process, and its load
+# state/timing can be inspected with status() (useful for debugging slow
+# Streamlit worker starts).
+import threading
+import time
+import traceback
+
+import config
+
+SIMILARITY_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+
+def _load_spacy():
+    import spacy
+    return spacy.load("en_core_web_sm")
+
+
+def _load_spacy_tokenizer():
+    # A blank English pipeline is just the tokenizer: no model download, no tagger/parser/NER
+    import spacy
+    return spacy.blank("en")
+
+
+def _load_zero_shot_classifier():
+    from transformers import pipeline
+    return pipeline("zero-shot-classification", model="facebook/bart-large-mnli")
+
+
+def _load_similarity_model():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(SIMILARITY_MODEL_NAME)
+
+
+def _load_gemini():
+    if not config.GEMINI_API_KEY:
+        print("GEMINI_API_KEY is not set")
+        return None
+    import google.generativeai as genai
+    genai.configure(api_key=config.GEMINI_API_KEY)
+    # Check if the API is actually working by listing models
+    models = list(genai.list_models())
+    if not models:
+        print("No Gemini models available")
+        return None
+    print(f"Successfully listed {len(models)} Gemini models")
+    return genai
+
+
+class ModelRegistry:
+    """Loads registered models on first use and caches one instance per process."""
+
+    def __init__(self):
+        self._loaders = {}
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, loader, description=None):
+        """Register a zero-argument loader under name (replaces any previous one)."""
+        with self._lock:
+            self._loaders[name] = (loader, description or name)
+            self._entries.pop(name, None)
+
+    def get(self, name):
+        """Return the model registered under name, loading it on first use.
+
+        A failed load is remembered and returns None on later calls, matching
+        the old import-time behaviour; call reset(name) to try again.
+        """
+        entry = self._entries.get(name)
+        if entry is not None:
+            return entry['model']
+
+        with self._lock:
+            # Another thread may have finished loading while we waited
+            entry = self._entries.get(name)
+            if entry is not None:
+                return entry['model']
+
+            if name not in self._loaders:
+                raise KeyError(f"Unknown model: {name}")
+            loader, description = self._loaders[name]
+
+            print(f"Loading {description}...")
+            start = time.perf_counter()
+            error = None
+            try:
+                model = loader()
+                if model is not None:
+                    print(f"{description} loaded successfully")
+            except Exception as e:
+                print(f"Error loading {description}: {str(e)}")
+                print(traceback.format_exc())
+                model = None
+                error = str(e)
+            elapsed = time.perf_counter() - start
+
+            self._entries[name] = {
+                'model': model,
+                'load_seconds': elapsed,
+                'loaded_at': time.time(),
+                'error': error,
+            }
+            return model
+
+    def is_loaded(self, name):
+        """True if name has been loaded successfully (never triggers a load)."""
+        entry = self._entries.get(name)
+        return entry is not None and entry['model'] is not None
+
+    def state(self, name):
+        """'not loaded', 'loaded' or 'failed' (never triggers a load)."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return 'not loaded'
+        return 'loaded' if entry['model'] is not None else 'failed'
+
+    def reset(self, name=None):
+        """Forget a loaded (or failed) model so the next get() reloads it."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def status(self):
+        """Return load state and timing for every registered model."""
+        report = {}
+        for name, (_, description) in self._loaders.items():
+            entry = self._entries.get(name)
+            if entry is None:
+                report[name] = {'description': description, 'state': 'not loaded'}
+            else:
+                report[name] = {
+                    'description': description,
+                    'state': self.state(name),
+                    'load_seconds': round(entry['load_seconds'], 3),
+                    'loaded_at': entry['loaded_at'],
+                    'error': entry['error'],
+                }
+        return report
+
+
+registry = ModelRegistry()
+registry.register('spacy', _load_spacy, "spaCy model")
+registry.register('spacy_tokenizer', _load_spacy_tokenizer, "spaCy tokenizer")
+registry.register('zero_shot', _load_zero_shot_classifier, "zero-shot classification pipeline")
+registry.register('similarity', _load_similarity_model, "SentenceTransformer model")
+registry.register('gemini', _load_gemini, "Google Gemini API")
+
+
+def get_nlp():
+    return registry.get('spacy')
+
+
+def get_tokenizer_nlp():
+    """Return a tokenizer-only spaCy pipeline (spacy.blank("en"))."""
+    return registry.get('spacy_tokenizer')
+
+
+def get_classifier():
+    return registry.get('zero_shot')
+
+
+def get_similarity_model():
+    return registry.get('similarity')
+
+
+def get_genai():
+    """Return the configured google.generativeai module, or None if Gemini is unavailable."""
+    return registry.get('gemini')
+
+
+def gemini_available():
+    return get_genai() is not None
+
+
+def gemini_state():
+    """Gemini's load state ('not loaded', 'loaded' or 'failed') without contacting the API."""
+    return registry.state('gemini')
@@ -0,0 +1,229 @@
+# Parallel, adaptive OCR for image-based PDF pages.
+#
+# Rendering a page and running Tesseract on it is CPU heavy, and doing it page
+# by page on one core makes scanned resumes slow. Pages are rendered and
+# recognized in a process pool instead. Each worker opens the PDF once from the
+# bytes handed to it at start-up, results come back in page order, and only
+# max_in_flight pages are queued at a time so a long scan can't pile up page
+# bitmaps in memory.
+#
+# Each page is first tried at a low resolution. Tesseract's word confidences
+# decide whether that was good enough; only low-confidence pages are rendered
+# again at full resolution. Page images are converted to grayscale and
+# binarized (Otsu threshold) in NumPy before recognition.
+import io
+import multiprocessing
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+import pdfplumber
+import pytesseract
+from PIL import Image
+
+import config
+
+# Per-process state for pool workers (and for the in-process fallback)
+_worker_pdf_bytes = None
+_worker_pdf = None
+
+
+def _init_worker(pdf_bytes, tesseract_cmd):
+    global _worker_pdf_bytes, _worker_pdf
+    _worker_pdf_bytes = pdf_bytes
+    _worker_pdf = None
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+
+def _get_worker_pdf():
+    global _worker_pdf
+    if _worker_pdf is None:
+        _worker_pdf = pdfplumber.open(io.BytesIO(_worker_pdf_bytes))
+    return _worker_pdf
+
+
+def resolution_ladder(min_resolution=None, max_resolution=None):
+    """Resolutions to try for each page, lowest first."""
+    max_resolution = max_resolution or config.OCR_RESOLUTION
+    min_resolution = config.OCR_MIN_RESOLUTION if min_resolution is None else min_resolution
+    if not min_resolution or min_resolution >= max_resolution:
+        return [max_resolution]
+    return [min_resolution, max_resolution]
+
+
+def to_grayscale(image):
+    """Return the page image as a 2-D uint8 array (ITU-R 601 luma, integer arithmetic)."""
+    if image.mode == "L":
+        return np.asarray(image)
+    rgb = np.asarray(image.convert("RGB"), dtype=np.uint16)
+    gray = (rgb[..., 0] * 77 + rgb[..., 1] * 150 + rgb[..., 2] * 29) >> 8
+    return gray.astype(np.uint8)
+
+
+def otsu_threshold(gray):
+    """Return the threshold that best separates ink from paper in a uint8 image."""
+    histogram = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    total = gray.size
+    levels = np.arange(256)
+    weight_background = np.cumsum(histogram)
+    weight_foreground = total - weight_background
+    cumulative_sum = np.cumsum(histogram * levels)
+    mean_background = cumulative_sum / np.maximum(weight_background, 1)
+    mean_foreground = (cumulative_sum[-1] - cumulative_sum) / np.maximum(weight_foreground, 1)
+    between_class_variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+    return int(np.argmax(between_class_variance))
+
+
+def preprocess_image(image):
+    """Grayscale and binarize a rendered page so Tesseract sees clean black-on-white text."""
+    gray = to_grayscale(image)
+    threshold = otsu_threshold(gray)
+    binary = np.where(gray > threshold, 255, 0).astype(np.uint8)
+    return Image.fromarray(binary)
+
+
+def recognize(image):
+    """OCR an image and return (text, mean word confidence 0-100, word count)."""
+    data = pytesseract.image_to_data(image, lang='eng', output_type=pytesseract.Output.DICT)
+    lines = []
+    words = []
+    confidences = []
+    current_line = None
+    for i, word in enumerate(data['text']):
+        line = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        if line != current_line:
+            if words:
+                lines.append(" ".join(words))
+            words = []
+            current_line = line
+        word = (word or "").strip()
+        if not word:
+            continue
+        words.append(word)
+        confidence = float(data['conf'][i])
+        if confidence >= 0:
+            confidences.append(confidence)
+    if words:
+        lines.append(" ".join(words))
+    text = "\n".join(lines) + "\n" if lines else ""
+    mean_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    return text, mean_confidence, len(confidences)
+
+
+def _ocr_page(page_index, resolutions, min_confidence, preprocess):
+    """Render one page and OCR it, escalating resolution while confidence is low; runs inside a pool worker."""
+    result = {'page': page_index + 1, 'text': "", 'render_seconds': 0.0, 'ocr_seconds': 0.0,
+              'resolution': None, 'confidence': 0.0, 'attempts': 0, 'error': None}
+    page = None
+    try:
+        page = _get_worker_pdf().pages[page_index]
+        for resolution in resolutions:
+            start = time.perf_counter()
+            image = page.to_image(resolution=resolution).original
+            if preprocess:
+                image = preprocess_image(image)
+            result['render_seconds'] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            text, confidence, _ = recognize(image)
+            result['ocr_seconds'] += time.perf_counter() - start
+            result['attempts'] += 1
+            del image
+
+            if result['resolution'] is None or confidence > result['confidence']:
+                result.update(text=text, confidence=confidence, resolution=resolution)
+            if confidence >= min_confidence:
+                break
+    except Exception as e:
+        result['error'] = str(e)
+        print(f"Error during OCR on page {page_index + 1}: {str(e)}")
+        print(traceback.format_exc())
+    finally:
+        # Release the page's parsed objects and cached text map before the next page
+        if page is not None:
+            page.close()
+    return result
+
+
+def iter_ocr_pdf_pages(pdf_bytes, page_indexes, max_workers=None, max_in_flight=None,
+                       resolutions=None, min_confidence=None, preprocess=None):
+    """OCR the given 0-based page indexes of a PDF, yielding per-page results in page order.
+
+    Each result has 'page' (1-based), 'text', 'render_seconds', 'ocr_seconds',
+    'resolution' (the DPI whose text was kept), 'confidence', 'attempts' and
+    'error'. Results are yielded as soon as every earlier page is done.
+    """
+    page_indexes = sorted(set(page_indexes))
+    if not page_indexes:
+        return
+    resolutions = resolutions or resolution_ladder()
+    min_confidence = config.OCR_MIN_CONFIDENCE if min_confidence is None else min_confidence
+    preprocess = config.OCR_PREPROCESS if preprocess is None else preprocess
+    page_args = (resolutions, min_confidence, preprocess)
+    max_workers = min(max_workers or config.OCR_MAX_WORKERS, len(page_indexes))
+    max_in_flight = max(max_in_flight or config.OCR_MAX_IN_FLIGHT, max_workers)
+    tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
+
+    if max_workers <= 1:
+        # Not worth starting a pool for a single page
+        _init_worker(pdf_bytes, tesseract_cmd)
+        try:
+            for index in page_indexes:
+                yield _ocr_page(index, *page_args)
+        finally:
+            if _worker_pdf is not None:
+                _worker_pdf.close()
+            _init_worker(None, None)
+        return
+
+    print(f"Running OCR on {len(page_indexes)} pages with {max_workers} processes")
+    # Spawned, not forked: the Streamlit process has threads (browser pool, warm-ups) whose
+    # locks a forked child could inherit held
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(pdf_bytes, tesseract_cmd),
+                             mp_context=multiprocessing.get_context("spawn")) as executor:
+        remaining = list(page_indexes)
+        in_flight = {}
+        results = {}
+        next_position = 0
+        while remaining or in_flight:
+            # Keep at most max_in_flight pages rendered or waiting at once
+            while remaining and len(in_flight) < max_in_flight:
+                index = remaining.pop(0)
+                in_flight[executor.submit(_ocr_page, index, *page_args)] = index
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    print(f"OCR worker failed on page {index + 1}: {str(e)}")
+                    results[index] = {'page': index + 1, 'text': "", 'render_seconds': 0.0,
+                                      'ocr_seconds': 0.0, 'resolution': None, 'confidence': 0.0,
+                                      'attempts': 0, 'error': str(e)}
+            while next_position < len(page_indexes) and page_indexes[next_position] in results:
+                yield results.pop(page_indexes[next_position])
+                next_position += 1
+
+
+def describe_result(result):
+    return (f"Page {result['page']} OCR: Extracted {len(result['text'])} characters "
+            f"at {result['resolution']} DPI, confidence {result['confidence']:.0f} "
+            f"(render {result['render_seconds']:.2f}s, OCR {result['ocr_seconds']:.2f}s, "
+            f"{result['attempts']} attempt(s))")
+
+
+def ocr_pdf_pages(pdf_bytes, page_indexes, max_workers=None, max_in_flight=None,
+                  resolutions=None, min_confidence=None, preprocess=None):
+    """OCR the given 0-based page indexes of a PDF and return per-page results in page order."""
+    start = time.perf_counter()
+    ordered = []
+    for result in iter_ocr_pdf_pages(pdf_bytes, page_indexes, max_workers, max_in_flight,
+                                     resolutions, min_confidence, preprocess):
+        print(describe_result(result))
+        ordered.append(result)
+    if ordered:
+        print(f"OCR of {len(ordered)} pages took {time.perf_counter() - start:.2f}s")
+    return ordered
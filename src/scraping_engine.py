@@ -0,0 +1,193 @@
+# Concurrent job scraping across platforms.
+#
+# The scrapers in utils are blocking network calls (and Naukri starts a
+# browser), so running them one after another makes a search cost the sum of
+# every platform's latency. This module fans the selected platforms out to a
+# thread pool, applies one global deadline, and hands back per-platform results
+# as soon as each one finishes. Platforms that miss the deadline are reported
+# as timed out and the jobs collected so far are still returned.
+#
+# The same approach is used for the job description fetch stage that feeds
+# match_jobs, with an extra cap on parallel requests per host.
+#
+# With CVISION_SCRAPE_BACKEND=async both stages run on the asyncio backend in
+# async_scraping instead (same results, no thread per request).
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+
+import async_scraping
+import config
+import utils
+
+PLATFORM_SCRAPERS = {
+    "LinkedIn": utils.scrape_linkedin,
+    "Upwork": utils.scrape_upwork,
+    "Fiverr": utils.scrape_fiverr,
+    "Indeed": utils.scrape_indeed,
+    "Naukri.com": utils.scrape_naukri,
+    "Internshala": utils.scrape_internshala,
+}
+
+
+def _use_async():
+    if config.SCRAPE_BACKEND != 'async':
+        return False
+    if not async_scraping.available():
+        print("httpx is not installed, using the threaded scraping backend")
+        return False
+    return True
+
+
+def _run_scraper(platform, domain):
+    start = time.perf_counter()
+    jobs = PLATFORM_SCRAPERS[platform](domain)
+    for job in jobs:
+        job['platform'] = platform
+    return jobs, time.perf_counter() - start
+
+
+def iter_platform_results(domain, platforms, deadline=None, max_workers=None):
+    """Scrape platforms concurrently and yield one result dict per platform as it completes.
+
+    Each result has 'platform', 'status' ('ok', 'error' or 'timeout'), 'jobs',
+    'seconds' and 'error'. Platforms still running when the deadline expires are
+    yielded with status 'timeout' and are not waited for.
+    """
+    if _use_async():
+        yield from async_scraping.iter_platform_results(domain, platforms, deadline)
+        return
+    deadline = config.SCRAPE_DEADLINE_SECONDS if deadline is None else deadline
+    max_workers = max_workers or config.SCRAPE_MAX_WORKERS
+    platforms = [p for p in platforms if p in PLATFORM_SCRAPERS]
+    if not platforms:
+        return
+
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(platforms)),
+                                  thread_name_prefix="scraper")
+    futures = {executor.submit(_run_scraper, platform, domain): platform for platform in platforms}
+    pending = set(futures)
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            pending.discard(future)
+            platform = futures[future]
+            try:
+                jobs, seconds = future.result()
+                print(f"Found {len(jobs)} jobs on {platform} in {seconds:.1f}s")
+                yield {'platform': platform, 'status': 'ok', 'jobs': jobs,
+                       'seconds': seconds, 'error': None}
+            except Exception as e:
+                print(f"Error scraping {platform}: {str(e)}")
+                print(traceback.format_exc())
+                yield {'platform': platform, 'status': 'error', 'jobs': [],
+                       'seconds': time.perf_counter() - start, 'error': str(e)}
+    except FuturesTimeoutError:
+        elapsed = time.perf_counter() - start
+        for future in pending:
+            platform = futures[future]
+            print(f"{platform} did not finish within the {deadline:.0f}s deadline")
+            yield {'platform': platform, 'status': 'timeout', 'jobs': [],
+                   'seconds': elapsed, 'error': f"Timed out after {deadline:.0f}s"}
+    finally:
+        # Don't block on stragglers; their threads finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def scrape_platforms(domain, platforms, deadline=None, max_workers=None, on_result=None):
+    """Scrape all platforms concurrently and return (all_jobs, results).
+
+    on_result, if given, is called with each per-platform result as it arrives
+    so callers can show progress. all_jobs keeps the order of platforms.
+    """
+    results = {}
+    for result in iter_platform_results(domain, platforms, deadline, max_workers):
+        results[result['platform']] = result
+        if on_result:
+            on_result(result)
+
+    all_jobs = []
+    for platform in platforms:
+        if platform in results:
+            all_jobs.extend(results[platform]['jobs'])
+    return all_jobs, [results[p] for p in platforms if p in results]
+
+
+def _interleave_by_host(urls):
+    """Order urls round-robin across hosts so one busy host doesn't tie up every worker."""
+    by_host = OrderedDict()
+    for url in urls:
+        by_host.setdefault(urlparse(url).netloc, []).append(url)
+    ordered = []
+    while by_host:
+        for host in list(by_host):
+            ordered.append(by_host[host].pop(0))
+            if not by_host[host]:
+                del by_host[host]
+    return ordered
+
+
+def fetch_job_descriptions(urls, deadline=None, max_workers=None, per_host=None):
+    """Fetch job descriptions concurrently and return {url: result}.
+
+    Each result has 'status' ('ok', 'empty', 'error' or 'timeout'),
+    'description', 'seconds' and 'error'. At most per_host requests run against
+    the same host at once, and urls not done by the deadline are marked
+    'timeout'.
+    """
+    if _use_async():
+        return async_scraping.fetch_job_descriptions(urls, deadline, per_host)
+    deadline = config.DESCRIPTION_FETCH_DEADLINE_SECONDS if deadline is None else deadline
+    max_workers = max_workers or config.DESCRIPTION_FETCH_MAX_WORKERS
+    per_host = per_host or config.DESCRIPTION_FETCH_PER_HOST
+
+    urls = _interleave_by_host(list(OrderedDict.fromkeys(url for url in urls if url)))
+    results = {}
+    if not urls:
+        return results
+
+    host_slots = {}
+    for url in urls:
+        host_slots.setdefault(urlparse(url).netloc, threading.BoundedSemaphore(per_host))
+
+    def fetch(url):
+        with host_slots[urlparse(url).netloc]:
+            start = time.perf_counter()
+            description = utils.fetch_job_description(url)
+            return description, time.perf_counter() - start
+
+    print(f"Fetching {len(urls)} job descriptions ({max_workers} workers, {per_host} per host)")
+    start = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(urls)),
+                                  thread_name_prefix="description")
+    futures = {executor.submit(fetch, url): url for url in urls}
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            url = futures[future]
+            try:
+                description, seconds = future.result()
+                results[url] = {'status': 'ok' if description else 'empty',
+                                'description': description, 'seconds': seconds, 'error': None}
+            except Exception as e:
+                print(f"Error fetching job description from {url}: {e}")
+                results[url] = {'status': 'error', 'description': "",
+                                'seconds': time.perf_counter() - start, 'error': str(e)}
+    except FuturesTimeoutError:
+        print(f"Job description fetch hit the {deadline:.0f}s deadline")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for url in urls:
+        if url not in results:
+            results[url] = {'status': 'timeout', 'description': "",
+                            'seconds': time.perf_counter() - start,
+                            'error': f"Timed out after {deadline:.0f}s"}
+
+    counts = {}
+    for result in results.values():
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    print(f"Fetched job descriptions in {time.perf_counter() - start:.1f}s: {counts}")
+    return results
@@ -0,0 +1,246 @@
+# Skill matching with all skill names and aliases compiled into one word-bounded regular expression.
+import bisect
+import re
+import threading
+from collections import namedtuple
+
+import config
+import model_registry
+
+SkillMatch = namedtuple('SkillMatch', ['skill', 'start', 'end', 'text'])
+
+# Skills this short ("R", "Go", "C#") are only matched with their exact
+# capitalization; "r" and "go" are ordinary words in lowercase text.
+CASE_SENSITIVE_MAX_LENGTH = 2
+
+
+def normalize_phrase(phrase):
+    return " ".join(phrase.split())
+
+
+def _trie_pattern(node):
+    """Turn a character trie into a regex that tries the longest continuation first."""
+    alternatives = []
+    for char in sorted(key for key in node if key != ''):
+        piece = r"\s+" if char == " " else re.escape(char)
+        alternatives.append(piece + _trie_pattern(node[char]))
+    if not alternatives:
+        return ""
+    if len(alternatives) == 1 and '' not in node:
+        return alternatives[0]
+    group = "(?:" + "|".join(alternatives) + ")"
+    return group + "?" if '' in node else group
+
+
+def compile_phrases(phrases, ignore_case=False):
+    """Compile phrases into one word-bounded regex, or None when there are none."""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = True
+    if not trie:
+        return None
+    # A match may not start or end inside a word ("go" in "google", "java" in "javascript").
+    # \b is much cheaper to test at every position, and means the same thing
+    # when every phrase starts with a word character.
+    start = r"\b" if all(re.match(r"\w", phrase) for phrase in phrases) else r"(?<!\w)"
+    pattern = start + _trie_pattern(trie) + r"(?!\w)"
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+class SkillMatcher:
+    """Finds all skills (and their aliases) in a text in a single pass."""
+
+    def __init__(self, skills, aliases=None):
+        self.skills = list(dict.fromkeys(skills))
+        # Lowercased phrase -> canonical skill name; short skills keep their case
+        self._folded = {}
+        self._exact = {}
+        for skill in self.skills:
+            self._add(skill, skill)
+        for skill, skill_aliases in (aliases or {}).items():
+            if skill in self.skills:
+                for alias in skill_aliases:
+                    self._add(alias, skill)
+        self._compile()
+
+        # Overlapping matches are resolved to the longest skill, so "Ruby on
+        # Rails" is one match; the shorter skills named inside it ("Ruby") are
+        # implied by it instead.
+        self._implied = {}
+        for skill in self.skills:
+            words = normalize_phrase(skill).split()
+            implied = []
+            for i in range(len(words)):
+                for j in range(i + 1, len(words) + 1):
+                    if j - i == len(words):
+                        continue
+                    inner = self._lookup(" ".join(words[i:j]))
+                    if inner and inner != skill and inner not in implied:
+                        implied.append(inner)
+            if implied:
+                self._implied[skill] = implied
+
+    def _compile(self):
+        # Lowercasing the text once and matching case-sensitively is about twice
+        # as fast as re.IGNORECASE; the latter is only needed for the rare text
+        # whose length changes when lowercased (so positions would shift).
+        self._folded_regex = compile_phrases(self._folded)
+        self._ignore_case_regex = compile_phrases(self._folded, ignore_case=True)
+        self._exact_regex = compile_phrases(self._exact)
+
+    def _add(self, phrase, skill):
+        phrase = normalize_phrase(phrase)
+        if not phrase:
+            return
+        if len(phrase) <= CASE_SENSITIVE_MAX_LENGTH:
+            self._exact.setdefault(phrase, skill)
+        else:
+            self._folded.setdefault(phrase.lower(), skill)
+
+    def _lookup(self, phrase):
+        if len(phrase) <= CASE_SENSITIVE_MAX_LENGTH:
+            return self._exact.get(phrase)
+        return self._folded.get(phrase.lower())
+
+    def find(self, text):
+        """Return SkillMatch(skill, start, end, text) for every occurrence, in text order."""
+        if not text:
+            return []
+        matches = []
+        if self._folded_regex:
+            lowered = text.lower()
+            if len(lowered) == len(text):
+                found = self._folded_regex.finditer(lowered)
+            else:
+                found = self._ignore_case_regex.finditer(text)
+            for match in found:
+                start, end = match.span()
+                phrase = match.group()
+                skill = self._folded.get(phrase) or self._folded[normalize_phrase(phrase).lower()]
+                matches.append(SkillMatch(skill, start, end, text[start:end]))
+        if self._exact_regex:
+            starts = [match.start for match in matches]
+            exact_matches = []
+            for match in self._exact_regex.finditer(text):
+                start, end = match.span()
+                # "C#" inside an already matched longer skill doesn't count twice
+                previous = bisect.bisect_right(starts, start) - 1
+                if previous >= 0 and end <= matches[previous].end:
+                    continue
+                skill = self._exact.get(match.group()) or self._exact[normalize_phrase(match.group())]
+                exact_matches.append(SkillMatch(skill, start, end, match.group()))
+            if exact_matches:
+                matches = sorted(matches + exact_matches, key=lambda match: match.start)
+        return matches
+
+    def find_many(self, texts, n_process=1, batch_size=None):
+        """find() for each text, in order. n_process and batch_size only matter for spaCy."""
+        return [self.find(text) for text in texts]
+
+    def skills_in(self, text):
+        """Return the distinct canonical skills found in text, in order of first mention.
+
+        Skills named inside a longer matched skill ("Ruby" in "Ruby on Rails")
+        are included right after it.
+        """
+        return self._distinct_skills(self.find(text))
+
+    def skills_in_many(self, texts, n_process=1, batch_size=None):
+        """skills_in() for each text, in order."""
+        return [self._distinct_skills(matches) for matches in self.find_many(texts, n_process, batch_size)]
+
+    def _distinct_skills(self, matches):
+        found = {}
+        for match in matches:
+            found[match.skill] = True
+            for inner in self._implied.get(match.skill, ()):
+                found[inner] = True
+        return list(found)
+
+
+class SpacySkillMatcher(SkillMatcher):
+    """Token-level skill matching with a tokenizer-only spaCy pipeline.
+
+    Texts go through nlp.make_doc (tokenization only, no tagger, parser or
+    NER) and a PhraseMatcher on lowercased tokens, so boundaries follow
+    spaCy's tokenization instead of regex word boundaries.
+    """
+
+    def __init__(self, skills, aliases=None, nlp=None):
+        self.nlp = nlp
+        super().__init__(skills, aliases)
+
+    def _compile(self):
+        from spacy.matcher import PhraseMatcher
+
+        self._folded_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        self._exact_matcher = PhraseMatcher(self.nlp.vocab, attr="ORTH")
+        for matcher, phrases in ((self._folded_matcher, self._folded), (self._exact_matcher, self._exact)):
+            by_skill = {}
+            for phrase, skill in phrases.items():
+                by_skill.setdefault(skill, []).append(self.nlp.make_doc(phrase))
+            for skill, patterns in by_skill.items():
+                matcher.add(skill, patterns)
+
+    @staticmethod
+    def _flatten_whitespace(text):
+        # Line breaks would become tokens of their own and split multi-word
+        # skills; replacing them one for one keeps character offsets intact.
+        return text.replace("\r", " ").replace("\n", " ").replace("\t", " ")
+
+    def find(self, text):
+        if not text:
+            return []
+        return self._doc_matches(self.nlp.make_doc(self._flatten_whitespace(text)), text)
+
+    def find_many(self, texts, n_process=1, batch_size=None):
+        """Tokenize all texts with nlp.pipe (in n_process worker processes) and match each doc."""
+        texts = [text or "" for text in texts]
+        docs = self.nlp.pipe((self._flatten_whitespace(text) for text in texts),
+                             n_process=n_process, batch_size=batch_size or 64)
+        return [self._doc_matches(doc, text) for doc, text in zip(docs, texts)]
+
+    def _doc_matches(self, doc, text):
+        from spacy.tokens import Span
+        from spacy.util import filter_spans
+
+        spans = []
+        for matcher in (self._folded_matcher, self._exact_matcher):
+            for match_id, start, end in matcher(doc):
+                spans.append(Span(doc, start, end, label=match_id))
+        # Overlapping matches resolve to the longest one, as in SkillMatcher
+        return [SkillMatch(span.label_, span.start_char, span.end_char, text[span.start_char:span.end_char])
+                for span in sorted(filter_spans(spans), key=lambda span: span.start)]
+
+
+_matchers = {}
+_matchers_lock = threading.Lock()
+
+
+def get_matcher(skills, aliases=None, mode=None):
+    """Return a compiled matcher for this skill list, building it only the first time.
+
+    mode is 'regex' (SkillMatcher) or 'spacy' (SpacySkillMatcher); it defaults
+    to config.SKILL_MATCHER. The spaCy mode falls back to the regex matcher
+    when spaCy is not installed.
+    """
+    mode = mode or config.SKILL_MATCHER
+    nlp = None
+    if mode == 'spacy':
+        nlp = model_registry.get_tokenizer_nlp()
+        if nlp is None:
+            print("spaCy tokenizer not available, using the regex skill matcher")
+            mode = 'regex'
+    key = (mode, tuple(skills), tuple((skill, tuple(names)) for skill, names in sorted((aliases or {}).items())))
+    with _matchers_lock:
+        matcher = _matchers.get(key)
+        if matcher is None:
+            if mode == 'spacy':
+                matcher = SpacySkillMatcher(skills, aliases, nlp)
+            else:
+                matcher = SkillMatcher(skills, aliases)
+            _matchers[key] = matcher
+        return matcher
@@ -0,0 +1,94 @@
+# The skill taxonomy: which skills CVision looks for, their aliases and the
+# categories they are grouped under in the CV Analysis panel.
+#
+# The data lives in skills_taxonomy.json (or the file named by
+# CVISION_SKILL_TAXONOMY) and is loaded once per process into lookup tables:
+# skill -> categories, skill -> aliases, and a compiled skill matcher per
+# matching mode. Categorizing found skills is a dict lookup per skill, so
+# Streamlit reruns don't rebuild anything and the taxonomy can grow to
+# thousands of skills.
+import json
+import os
+import threading
+
+import config
+import skill_matcher
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills_taxonomy.json")
+
+
+class SkillTaxonomy:
+    """Indexed skill taxonomy built from the JSON data file."""
+
+    def __init__(self, data):
+        self.version = data.get('version', 1)
+        self.categories = list(data.get('categories', []))
+        self.skills = []
+        self.aliases = {}
+        self.skill_categories = {}
+        for entry in data.get('skills', []):
+            name = entry['name']
+            if name in self.skill_categories:
+                continue
+            self.skills.append(name)
+            self.skill_categories[name] = tuple(entry.get('categories', ()))
+            if entry.get('aliases'):
+                self.aliases[name] = list(entry['aliases'])
+        self._matchers = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=None):
+        path = path or config.SKILL_TAXONOMY_PATH or DEFAULT_PATH
+        with open(path, encoding='utf-8') as f:
+            taxonomy = cls(json.load(f))
+        print(f"Loaded skill taxonomy v{taxonomy.version} from {path}: "
+              f"{len(taxonomy.skills)} skills, {len(taxonomy.categories)} categories")
+        return taxonomy
+
+    def matcher(self, mode=None):
+        """Return the compiled matcher for this taxonomy (built once per mode)."""
+        mode = mode or config.SKILL_MATCHER
+        matcher = self._matchers.get(mode)
+        if matcher is None:
+            with self._lock:
+                matcher = self._matchers.get(mode)
+                if matcher is None:
+                    matcher = skill_matcher.get_matcher(self.skills, self.aliases, mode)
+                    self._matchers[mode] = matcher
+        return matcher
+
+    def extract(self, text, mode=None):
+        """Return the taxonomy skills found in text, in order of first mention."""
+        return self.matcher(mode).skills_in(text)
+
+    def categorize(self, skills):
+        """Group skills by category, in taxonomy category order.
+
+        Returns (categorized, uncategorized): an ordered {category: [skills]}
+        with only non-empty categories, and the skills that belong to none.
+        A skill listed under several categories appears in each of them.
+        """
+        grouped = {category: [] for category in self.categories}
+        uncategorized = []
+        for skill in skills:
+            categories = self.skill_categories.get(skill, ())
+            for category in categories:
+                grouped.setdefault(category, []).append(skill)
+            if not categories:
+                uncategorized.append(skill)
+        return {category: found for category, found in grouped.items() if found}, uncategorized
+
+
+_taxonomy = None
+_taxonomy_lock = threading.Lock()
+
+
+def get_taxonomy():
+    """Return the process-wide taxonomy, loading it on first use."""
+    global _taxonomy
+    if _taxonomy is None:
+        with _taxonomy_lock:
+            if _taxonomy is None:
+                _taxonomy = SkillTaxonomy.load()
+    return _taxonomy
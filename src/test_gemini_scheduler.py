@@ -0,0 +1,64 @@
+import time
+
+from gemini_scheduler import GeminiScheduler, StubBackend
+
+
+def test_priority_order():
+    """With one worker, requests must run strictly in priority order."""
+    backend = StubBackend(response=lambda prompt: prompt.upper())
+    scheduler = GeminiScheduler(backend, requests_per_minute=0, tokens_per_minute=0, max_concurrency=1)
+    requests = [(3, 'c', 'third'), (1, 'a', 'first'), (2, 'b', 'second')]
+    results = scheduler.run(requests)
+    assert backend.calls == ['first', 'second', 'third'], backend.calls
+    assert results['a']['text'] == 'FIRST'
+    print("✅ Requests ran in priority order")
+
+
+def test_concurrency():
+    """Eight 0.2s requests on four workers should take about 0.4s, not 1.6s."""
+    backend = StubBackend(latency=0.2)
+    scheduler = GeminiScheduler(backend, requests_per_minute=0, tokens_per_minute=0, max_concurrency=4)
+    start = time.perf_counter()
+    results = scheduler.run([(i, i, f"prompt {i}") for i in range(8)])
+    elapsed = time.perf_counter() - start
+    assert all(result['status'] == 'ok' for result in results.values())
+    assert elapsed < 1.0, elapsed
+    print(f"✅ 8 requests on 4 workers finished in {elapsed:.2f}s")
+
+
+def test_quota_backoff():
+    """429s are retried with backoff until the request succeeds or retries run out."""
+    backend = StubBackend(fail_first=2)
+    scheduler = GeminiScheduler(backend, requests_per_minute=0, tokens_per_minute=0,
+                                max_concurrency=1, max_retries=3, backoff_seconds=0.05)
+    result = scheduler.run([(0, 'job', 'prompt')])['job']
+    assert result['status'] == 'ok' and result['attempts'] == 3, result
+    print(f"✅ Quota errors retried ({result['attempts']} attempts)")
+
+    backend = StubBackend(fail_first=10)
+    scheduler = GeminiScheduler(backend, requests_per_minute=0, tokens_per_minute=0,
+                                max_concurrency=1, max_retries=1, backoff_seconds=0.05)
+    result = scheduler.run([(0, 'job', 'prompt')])['job']
+    assert result['status'] == 'quota', result
+    print("✅ Exhausted retries reported as quota error")
+
+
+def test_rate_limit():
+    """A 3-requests-per-window budget delays the 4th request until the window slides."""
+    backend = StubBackend()
+    scheduler = GeminiScheduler(backend, requests_per_minute=3, tokens_per_minute=0, max_concurrency=4)
+    scheduler.limiter.window_seconds = 0.5
+    start = time.perf_counter()
+    scheduler.run([(i, i, "prompt") for i in range(4)])
+    elapsed = time.perf_counter() - start
+    assert elapsed >= 0.45, elapsed
+    print(f"✅ Rate limit enforced (4 requests took {elapsed:.2f}s with a 3-per-0.5s budget)")
+
+
+if __name__ == "__main__":
+    print("\n===== Testing Gemini Scheduler (stub backend) =====\n")
+    test_priority_order()
+    test_concurrency()
+    test_quota_backoff()
+    test_rate_limit()
+    print("\n✅ All scheduler checks passed")
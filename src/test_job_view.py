@@ -0,0 +1,40 @@
+import job_view
+
+
+def ranked_jobs(count, analyzed):
+    """Jobs as match_jobs returns them: best first, the top `analyzed` with a Gemini analysis."""
+    jobs = [{'title': f"Job {i}", 'link': f"https://example.com/{i}", 'match_score': 1 - i / 100}
+            for i in range(count)]
+    for job in jobs[:analyzed]:
+        job['gemini_analysis'] = "analysis"
+    return jobs
+
+
+def test_on_demand_button_past_top_k():
+    """With top-K below the page size, the jobs past top-K on the page get the Analyze button."""
+    jobs = ranked_jobs(count=8, analyzed=3)
+    shown = job_view.page_jobs(jobs, page=1, per_page=10)
+    with_button = [rank for rank, job in shown if job_view.needs_analysis(job)]
+    assert [rank for rank, _ in shown] == list(range(8))
+    assert with_button == [3, 4, 5, 6, 7], with_button
+    print("✅ Analyze button offered for jobs ranked past top-K")
+
+
+def test_all_ranked_jobs_reachable():
+    """Jobs beyond the first page are shown on later pages, keeping their overall rank."""
+    jobs = ranked_jobs(count=23, analyzed=10)
+    assert job_view.page_count(jobs, per_page=10) == 3
+    seen = [rank for page in (1, 2, 3) for rank, _ in job_view.page_jobs(jobs, page, per_page=10)]
+    assert seen == list(range(23)), seen
+    page_two = job_view.page_jobs(jobs, 2, per_page=10)
+    assert all(job_view.needs_analysis(job) for _, job in page_two)
+    # Out-of-range pages are clamped rather than empty
+    assert job_view.page_jobs(jobs, 9, per_page=10) == job_view.page_jobs(jobs, 3, per_page=10)
+    print("✅ Every ranked job is reachable through the pages")
+
+
+if __name__ == "__main__":
+    print("\n===== Testing job result paging =====\n")
+    test_on_demand_button_past_top_k()
+    test_all_ranked_jobs_reachable()
+    print("\n✅ All job paging checks passed")
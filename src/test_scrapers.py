@@ -34,5 +34,17 @@ def test_all_scrapers():
     print(f"Found {len(internshala_jobs)} jobs on Internshala.")
     # print(internshala_jobs)
 
+def test_concurrent_scrapers():
+    import scraping_engine
+
+    query = "Software Engineer"
+    platforms = list(scraping_engine.PLATFORM_SCRAPERS)
+    print(f"\n--- Testing concurrent scraping for query: '{query}' ---")
+    all_jobs, results = scraping_engine.scrape_platforms(query, platforms)
+    for result in results:
+        print(f"{result['platform']}: {result['status']}, {len(result['jobs'])} jobs in {result['seconds']:.1f}s")
+    print(f"Found {len(all_jobs)} jobs in total.")
+
 if __name__ == "__main__":
-    test_all_scrapers()
\ No newline at end of file
+    test_all_scrapers()
+    test_concurrent_scrapers()
\ No newline at end of file
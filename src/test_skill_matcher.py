@@ -0,0 +1,75 @@
+import pytest
+
+import skill_taxonomy
+
+
+def skills_in(text):
+    return skill_taxonomy.get_taxonomy().matcher('regex').skills_in(text)
+
+
+def test_word_boundaries():
+    """Short skills must not match inside other words ("Go" in "Google", "R" in "framework")."""
+    found = skills_in("Worked at Google on a reporting framework for Android.")
+    assert 'Go' not in found, found
+    assert 'R' not in found, found
+    found = skills_in("Services in Go and statistics in R.")
+    assert 'Go' in found and 'R' in found, found
+    print("✅ Skills only match whole words")
+
+
+def test_symbol_skills():
+    """Skills ending in symbols (C++, C#) match even though \\b can't follow them."""
+    found = skills_in("Game engines in C++, tooling in C# and scripts in Python.")
+    assert 'C++' in found and 'C#' in found, found
+    assert 'C' not in found, found
+    print("✅ C++ and C# matched")
+
+
+def test_aliases():
+    """Aliases map to the canonical skill name."""
+    found = skills_in("Frontend work in JS and Golang microservices.")
+    assert 'JavaScript' in found and 'Go' in found, found
+    assert 'JS' not in found and 'Golang' not in found, found
+    print("✅ Aliases resolved to canonical skills")
+
+
+def test_longest_match_implies_nested_skills():
+    """"Ruby on Rails" is one match that also implies Ruby."""
+    found = skills_in("Built web apps with Ruby on Rails.")
+    assert found.index('Ruby on Rails') < found.index('Ruby'), found
+    print("✅ Ruby on Rails implies Ruby")
+
+
+def test_batch_alignment():
+    """skills_in_many returns one list per input text, in order."""
+    texts = ["Python and SQL", "", "Docker, Kubernetes"]
+    results = skill_taxonomy.get_taxonomy().matcher('regex').skills_in_many(texts)
+    assert results == [skills_in(text) for text in texts], results
+    assert results[1] == []
+    print("✅ Batch matching stays aligned with its input")
+
+
+def test_extract_skills_batch_alignment():
+    """extract_skills_batch keeps empty and extraction-error texts in place with []."""
+    utils = pytest.importorskip("utils")
+    texts = ["Python and SQL", "", "Error processing file. Please try again.", None, "Java developer"]
+    results = utils.extract_skills_batch(texts)
+    assert len(results) == len(texts)
+    assert results[1] == results[2] == results[3] == []
+    assert results[0] == utils.extract_skills(texts[0])
+    assert results[4] == utils.extract_skills(texts[4])
+    print("✅ extract_skills_batch stays aligned with its input")
+
+
+if __name__ == "__main__":
+    print("\n===== Testing skill matching =====\n")
+    test_word_boundaries()
+    test_symbol_skills()
+    test_aliases()
+    test_longest_match_implies_nested_skills()
+    test_batch_alignment()
+    try:
+        test_extract_skills_batch_alignment()
+    except pytest.skip.Exception as e:
+        print(f"Skipped extract_skills_batch check: {e}")
+    print("\n✅ All skill matching checks passed")